@@ -1,12 +1,15 @@
 # Content Generation Agent
 import os
-from typing import Dict, Any, List
+import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from prompts.agent_prompts import ContentPrompts
 from openai import OpenAI
-from dotenv import load_dotenv
+from utils.env_loader import ensure_env_loaded
 
 # Load environment variables
-load_dotenv()
+ensure_env_loaded()
 
 class ContentAgent:
     """Agent responsible for generating content suggestions and improvements using OpenAI"""
@@ -57,14 +60,20 @@ class ContentAgent:
         ai_content = {}
         
         try:
-            # Generate AI headline suggestions
-            ai_content['ai_headlines'] = self._generate_ai_headlines(analysis, job_description)
-            
-            # Generate AI about section
-            ai_content['ai_about_section'] = self._generate_ai_about_section(analysis, job_description)
-            
-            # Generate AI experience descriptions
-            ai_content['ai_experience_descriptions'] = self._generate_ai_experience_descriptions(analysis)
+            # The three completions are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                headlines_future = executor.submit(self._generate_ai_headlines, analysis, job_description)
+                about_future = executor.submit(self._generate_ai_about_section, analysis, job_description)
+                experience_future = executor.submit(self._generate_ai_experience_descriptions, analysis)
+                
+                # Generate AI headline suggestions
+                ai_content['ai_headlines'] = headlines_future.result()
+                
+                # Generate AI about section
+                ai_content['ai_about_section'] = about_future.result()
+                
+                # Generate AI experience descriptions
+                ai_content['ai_experience_descriptions'] = experience_future.result()
             
         except Exception as e:
             print(f"Error generating AI content: {str(e)}")
@@ -330,6 +339,113 @@ class ContentAgent:
         
         return template.strip()
     
+    def submit_batch(self, prompts: Dict[str, str], max_tokens: int = 500, temperature: float = 0.7) -> Optional[str]:
+        """
+        Submit many prompts as one OpenAI Batch API job (half price, results within 24h)
+        
+        Args:
+            prompts (Dict[str, str]): Prompt text keyed by a caller-chosen custom_id
+            max_tokens (int): Completion token limit per prompt
+            temperature (float): Sampling temperature per prompt
+            
+        Returns:
+            Optional[str]: Batch ID to pass to wait_for_batch, or None if submission failed
+        """
+        if not self.openai_client or not prompts:
+            return None
+        
+        lines = [
+            orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o-mini",
+                    "messages": [{"role": "user", "content": prompt}],
+                    "max_tokens": max_tokens,
+                    "temperature": temperature
+                }
+            })
+            for custom_id, prompt in prompts.items()
+        ]
+        
+        try:
+            batch_file = self.openai_client.files.create(
+                file=("batch_input.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = self.openai_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            print(f"📦 Submitted OpenAI batch {batch.id} with {len(lines)} requests")
+            return batch.id
+        except Exception as e:
+            print(f"Error submitting OpenAI batch: {str(e)}")
+            return None
+    
+    def wait_for_batch(self, batch_id: str, poll_interval: float = 30.0, timeout: float = 24 * 3600) -> Dict[str, str]:
+        """
+        Poll a submitted batch until it finishes and return the completions
+        
+        Args:
+            batch_id (str): ID returned by submit_batch
+            poll_interval (float): Seconds between status checks
+            timeout (float): Seconds to wait before giving up
+            
+        Returns:
+            Dict[str, str]: Completion text keyed by custom_id; failed, refused or
+                malformed requests are omitted
+        """
+        if not self.openai_client:
+            return {}
+        
+        deadline = time.monotonic() + timeout
+        try:
+            batch = self.openai_client.batches.retrieve(batch_id)
+            while batch.status in ("validating", "in_progress", "finalizing"):
+                if time.monotonic() >= deadline:
+                    print(f"⏰ OpenAI batch {batch_id} still {batch.status} after {timeout:.0f}s")
+                    return {}
+                time.sleep(poll_interval)
+                batch = self.openai_client.batches.retrieve(batch_id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                print(f"❌ OpenAI batch {batch_id} ended with status: {batch.status}")
+                return {}
+            
+            output = self.openai_client.files.content(batch.output_file_id).text
+        except Exception as e:
+            print(f"Error retrieving OpenAI batch: {str(e)}")
+            return {}
+        
+        results = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            
+            # One bad line must not cost the rest of the batch
+            try:
+                item = orjson.loads(line)
+                custom_id = item["custom_id"]
+                response = item.get("response") or {}
+                if response.get("status_code") != 200:
+                    print(f"⚠️ Batch request {custom_id} failed: {item.get('error')}")
+                    continue
+                message = response["body"]["choices"][0]["message"]
+                content = message.get("content")
+            except (orjson.JSONDecodeError, KeyError, IndexError, TypeError, AttributeError) as e:
+                print(f"⚠️ Skipping malformed batch output line: {str(e)}")
+                continue
+            
+            if not isinstance(content, str):
+                print(f"⚠️ Batch request {custom_id} returned no content: {message.get('refusal')}")
+                continue
+            results[custom_id] = content.strip()
+        
+        return results
+    
     def test_openai_connection(self) -> bool:
         """Test if OpenAI connection is working"""
         if not self.openai_client:
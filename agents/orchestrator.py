@@ -9,7 +9,7 @@ class ProfileOrchestrator:
     """Main coordinator for all LinkedIn profile enhancement agents"""
     
     def __init__(self):
-        self.scraper = ScraperAgent()
+        self.scraper = ScraperAgent.shared()
         self.analyzer = AnalyzerAgent()
         self.content_generator = ContentAgent()
         self.memory = MemoryManager()
@@ -41,7 +41,12 @@ class ProfileOrchestrator:
             # Step 1: Scrape LinkedIn profile data
             print("📡 Step 1: Scraping profile data...")
             print(f"🔗 Target URL: {linkedin_url}")
-            profile_data = self.scraper.extract_profile_data(linkedin_url)
+            profile_data = self.scraper.extract_profile_data(linkedin_url, force_refresh=force_refresh)
+            
+            # Nothing to analyze; don't spend an OpenAI round-trip on an empty scrape
+            if not profile_data or not profile_data.get('name'):
+                print("❌ Scrape returned no profile data, skipping analysis and suggestions")
+                return "Error in orchestration: No profile data could be extracted from this URL"
             
             # Verify we got data for the correct URL
             if profile_data.get('url') != linkedin_url:
@@ -53,6 +58,10 @@ class ProfileOrchestrator:
             print("🔍 Step 2: Analyzing profile...")
             analysis = self.analyzer.analyze_profile(profile_data, job_description)
             
+            if not analysis:
+                print("❌ Analysis returned no results, skipping suggestions")
+                return "Error in orchestration: Profile analysis produced no results"
+            
             # Step 3: Generate enhancement suggestions
             print("💡 Step 3: Generating suggestions...")
             suggestions = self.content_generator.generate_suggestions(analysis, job_description)
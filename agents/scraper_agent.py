@@ -1,16 +1,31 @@
 import os
 import time
-import json
+import threading
+import orjson
 import requests
-from typing import Dict, Any
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, List
+from utils.env_loader import ensure_env_loaded
+from utils.profile_cache import ProfileCache
 
 # Load environment variables
-load_dotenv()
+ensure_env_loaded()
 
 class ScraperAgent:
     """Agent responsible for extracting data from LinkedIn profiles using Apify REST API"""
     
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls) -> 'ScraperAgent':
+        """Return a process-wide ScraperAgent so callers share one connection pool"""
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls()
+        return cls._shared_instance
+    
     def __init__(self):
         self.apify_token = os.getenv('APIFY_API_TOKEN')
         if not self.apify_token:
@@ -24,13 +39,21 @@ class ScraperAgent:
         self.api_url = f"https://api.apify.com/v2/acts/dev_fusion~linkedin-profile-scraper/run-sync-get-dataset-items?token={self.apify_token}"
         
         print(f"🔑 Using Apify token: {self.apify_token[:15]}...")  # Show first 15 chars for debugging
+        
+        # Persistent cache so repeat scrapes of the same profile skip Apify
+        self.profile_cache = ProfileCache()
+        
+        # Keep-alive session so repeat Apify calls skip the TCP/TLS handshake
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
     
-    def extract_profile_data(self, linkedin_url: str) -> Dict[str, Any]:
+    def extract_profile_data(self, linkedin_url: str, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Extract profile data from LinkedIn URL using Apify REST API
         
         Args:
             linkedin_url (str): LinkedIn profile URL
+            force_refresh (bool): Scrape again even if a cached profile exists
             
         Returns:
             Dict[str, Any]: Extracted profile data
@@ -52,23 +75,20 @@ class ScraperAgent:
             if original_url != linkedin_url:
                 print(f"🔄 URL normalized: {original_url} → {linkedin_url}")
             
+            if not force_refresh:
+                cached_data = self.profile_cache.get(linkedin_url)
+                if cached_data:
+                    print(f"💾 Using cached profile data for: {linkedin_url}")
+                    return cached_data
+            
             # Configure the run input with fresh URL
-            run_input = {
-                "profileUrls": [linkedin_url],  # This actor expects profileUrls, not startUrls
-                "slowDown": True,  # To avoid being blocked
-                "includeSkills": True,
-                "includeExperience": True,
-                "includeEducation": True,
-                "includeRecommendations": False,  # Optional, can be slow
-                "saveHtml": False,
-                "saveMarkdown": False
-            }
+            run_input = self._build_run_input([linkedin_url])
             
-            print(f"📋 Apify input: {json.dumps(run_input, indent=2)}")
+            print(f"📋 Apify input: {orjson.dumps(run_input, option=orjson.OPT_INDENT_2).decode()}")
             
             # Make the API request
             print("🚀 Running Apify scraper via REST API...")
-            response = requests.post(
+            response = self._session.post(
                 self.api_url,
                 json=run_input,
                 headers={'Content-Type': 'application/json'},
@@ -76,13 +96,14 @@ class ScraperAgent:
             )
             
             if response.status_code in [200, 201]:  # 201 is also success for Apify
-                results = response.json()
+                results = orjson.loads(response.content)
                 print(f"✅ API Response received: {len(results)} items")
                 
                 if results and len(results) > 0:
                     # Process the first result (since we're scraping one profile)
                     raw_data = results[0]
                     processed_data = self._process_apify_data(raw_data, linkedin_url)
+                    self.profile_cache.set(linkedin_url, processed_data)
                     print("✅ Successfully extracted and processed profile data")
                     return processed_data
                 else:
@@ -123,6 +144,81 @@ class ScraperAgent:
             print(f"❌ {error_msg}")
             raise Exception(error_msg)
     
+    def batch_extract(self, linkedin_urls: List[str], force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract several profiles with a single Apify actor run
+        
+        Args:
+            linkedin_urls (List[str]): LinkedIn profile URLs
+            force_refresh (bool): Scrape again even if cached profiles exist
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Profile data keyed by cleaned URL; profiles
+                the actor returned nothing for are omitted
+        """
+        results = {}
+        pending = {}  # normalized cache key -> cleaned URL still to scrape
+        
+        for linkedin_url in linkedin_urls:
+            linkedin_url = linkedin_url.strip()
+            if not linkedin_url.startswith('http'):
+                linkedin_url = 'https://' + linkedin_url
+            
+            cached_data = None if force_refresh else self.profile_cache.get(linkedin_url)
+            if cached_data:
+                print(f"💾 Using cached profile data for: {linkedin_url}")
+                results[linkedin_url] = cached_data
+            else:
+                pending[ProfileCache.normalize_url(linkedin_url)] = linkedin_url
+        
+        if not pending:
+            return results
+        
+        print(f"🚀 Running Apify scraper for {len(pending)} profiles in one request...")
+        response = self._session.post(
+            self.api_url,
+            json=self._build_run_input(list(pending.values())),
+            headers={'Content-Type': 'application/json'},
+            timeout=180 + 60 * (len(pending) - 1)  # Each extra profile adds scrape time to the run
+        )
+        if response.status_code not in [200, 201]:
+            error_msg = f"API request failed with status {response.status_code} - {response.text}"
+            print(f"❌ {error_msg}")
+            raise requests.RequestException(error_msg)
+        
+        # Demultiplex dataset items back onto the requested URLs
+        handles = {key.rsplit('/', 1)[-1]: key for key in pending}
+        for raw_data in orjson.loads(response.content):
+            key = ProfileCache.normalize_url(raw_data.get('linkedinUrl') or '')
+            if key not in pending:
+                key = handles.get((raw_data.get('publicIdentifier') or '').lower())
+            if key not in pending:
+                print(f"⚠️ Could not match Apify result to a requested URL: {raw_data.get('linkedinUrl')}")
+                continue
+            
+            linkedin_url = pending.pop(key)
+            processed_data = self._process_apify_data(raw_data, linkedin_url)
+            self.profile_cache.set(linkedin_url, processed_data)
+            results[linkedin_url] = processed_data
+        
+        for linkedin_url in pending.values():
+            print(f"❌ No data returned for: {linkedin_url}")
+        
+        return results
+    
+    def _build_run_input(self, profile_urls: List[str]) -> Dict[str, Any]:
+        """Build the Apify actor input for the given profile URLs"""
+        return {
+            "profileUrls": profile_urls,  # This actor expects profileUrls, not startUrls
+            "slowDown": True,  # To avoid being blocked
+            "includeSkills": True,
+            "includeExperience": True,
+            "includeEducation": True,
+            "includeRecommendations": False,  # Optional, can be slow
+            "saveHtml": False,
+            "saveMarkdown": False
+        }
+    
     def test_apify_connection(self) -> bool:
         """Test if Apify connection is working"""
         try:
@@ -130,7 +226,7 @@ class ScraperAgent:
             test_url = f"https://api.apify.com/v2/acts/dev_fusion~linkedin-profile-scraper?token={self.apify_token}"
             print(f"🔗 Testing connection to: {test_url[:50]}...")
             
-            response = requests.get(test_url, timeout=10)
+            response = self._session.get(test_url, timeout=10)
             
             if response.status_code == 200:
                 actor_info = response.json()
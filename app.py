@@ -4,238 +4,476 @@ LinkedIn Profile Enhancer - Gradio Interface (app2.py)
 A beautiful web interface for the LinkedIn Profile Enhancer using Gradio
 """
 
+from __future__ import annotations
+
 import sys
 import os
 import time
 import json
-from typing import Dict, Any, Tuple, Optional
-import gradio as gr
-from PIL import Image
-import requests
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Tuple, Optional, Iterator, TYPE_CHECKING
 from io import BytesIO
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add project root to path once, even if this module is re-imported
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.validators import LINKEDIN_URL_PATTERN
+
+# Gradio, Pillow, httpx and the agents are imported where they are first
+# used so that `python app.py --help` does not pay their import cost
+if TYPE_CHECKING:
+    from PIL import Image
+
+@lru_cache(maxsize=1)
+def _get_image_client():
+    """Create the shared keep-alive HTTP/2 client for profile image downloads"""
+    import httpx
+    return httpx.Client(
+        http2=True,
+        timeout=10.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+    )
+
+@lru_cache(maxsize=128)
+def _fetch_image_bytes(image_url: str) -> bytes:
+    """Download raw image bytes, cached per URL for repeat extractions"""
+    response = _get_image_client().get(image_url)
+    response.raise_for_status()
+    return response.content
+
+# How long the last API status is reused on page load instead of probing the APIs
+STATUS_CACHE_TTL = 300  # seconds
+STATUS_NOT_TESTED = "⏸️ Not tested - click Test Connections"
+
+# How long a completed enhancement is reused for the same URL + job description
+ENHANCE_CACHE_TTL = 900  # seconds
+
+# Maximum number of profile enhancements processed at the same time
+ENHANCE_CONCURRENCY_LIMIT = 2
+
+# Static page assets for the Gradio interface
+CUSTOM_CSS = """
+.gradio-container {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    max-width: 1200px;
+    margin: 0 auto;
+}
+
+.header-text {
+    text-align: center;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 2rem;
+    border-radius: 10px;
+    margin-bottom: 2rem;
+}
+
+.status-box {
+    padding: 1rem;
+    border-radius: 8px;
+    margin: 0.5rem 0;
+}
+
+.success {
+    background-color: #d4edda;
+    border: 1px solid #c3e6cb;
+    color: #155724;
+}
+
+.error {
+    background-color: #f8d7da;
+    border: 1px solid #f5c6cb;
+    color: #721c24;
+}
+
+.info {
+    background-color: #e7f3ff;
+    border: 1px solid #b3d7ff;
+    color: #0c5460;
+}
+"""
+
+HEADER_HTML = """
+<div class="header-text">
+    <h1>🚀 LinkedIn Profile Enhancer</h1>
+    <p style="font-size: 1.2em; margin: 1rem 0;">AI-powered LinkedIn profile analysis and enhancement suggestions</p>
+    <div style="display: flex; justify-content: center; gap: 2rem; margin-top: 1rem;">
+        <div style="text-align: center;">
+            <div style="font-size: 2em;">🔍</div>
+            <div>Real Scraping</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 2em;">🤖</div>
+            <div>AI Analysis</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 2em;">🎯</div>
+            <div>Smart Suggestions</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 2em;">📊</div>
+            <div>Rich Data</div>
+        </div>
+    </div>
+</div>
+"""
+
+FOOTER_HTML = """
+<div style="text-align: center; margin-top: 2rem; padding: 1rem; border-top: 1px solid #eee;">
+    <p>🚀 <strong>LinkedIn Profile Enhancer</strong> | Powered by AI | Built with ❤️ using Gradio</p>
+    <p>Data scraped with respect to LinkedIn's ToS | Uses OpenAI GPT-4o-mini and Apify</p>
+</div>
+"""
+
+# Markdown templates, filled with str.format_map on each request
+BASIC_INFO_TEMPLATE = """
+**Name:** {name}
+**Headline:** {headline}
+**Location:** {location}
+**Connections:** {connections}
+**Followers:** {followers}
+**Email:** {email}
+**Current Job:** {job_title} at {company_name}
+"""
+
+DETAILS_TEMPLATE = """
+## 🎓 Education
+{education_text}
+
+## 🛠️ Skills
+{skills_text}
+
+## 🏆 Certifications
+{certifications_count} certifications found
+
+## 📊 Additional Data
+- Projects: {projects_count}
+- Publications: {publications_count}
+- Recommendations: {recommendations_count}
+"""
+
+EXPORT_PROFILE_TABLE_TEMPLATE = """## 👤 Basic Profile Information
+
+| Field | Current Value |
+|-------|---------------|
+| **Name** | {name} |
+| **Professional Headline** | {headline} |
+| **Location** | {location} |
+| **Connections** | {connections} |
+| **Followers** | {followers} |
+| **Email** | {email} |
+| **Current Position** | {job_title} at {company_name} |
+"""
+
+def join_truncated(items, limit: int, overflow: str = "\n...") -> str:
+    """Join the first `limit` items, appending `overflow` once if any were left out"""
+    return ", ".join(items[:limit]) + (overflow if len(items) > limit else "")
 
-from agents.orchestrator import ProfileOrchestrator
-from agents.scraper_agent import ScraperAgent
-from agents.analyzer_agent import AnalyzerAgent
-from agents.content_agent import ContentAgent
+class ProfileFields(dict):
+    """Mapping for template formatting that renders missing profile fields as 'N/A'"""
+    
+    def __missing__(self, key: str) -> str:
+        return 'N/A'
 
 class LinkedInEnhancerGradio:
     """Gradio Interface for LinkedIn Profile Enhancer"""
     
     def __init__(self):
+        from agents.orchestrator import ProfileOrchestrator
         self.orchestrator = ProfileOrchestrator()
         self.current_profile_data = None
         self.current_analysis = None
         self.current_suggestions = None
+        # (url, job description hash) -> (timestamp, result, profile, analysis, suggestions)
+        self._enhance_cache: Dict[Tuple[str, str], Tuple[float, tuple, Dict, Dict, Dict]] = {}
+        # (timestamp, apify status, openai status) from the last connection test
+        self._api_status: Optional[Tuple[float, str, str]] = None
     
-    def test_api_connections(self) -> Tuple[str, str]:
-        """Test API connections and return status"""
-        apify_status = "❌ Failed"
-        openai_status = "❌ Failed"
-        
+    def get_cached_api_status(self) -> Tuple[str, str]:
+        """Return the last-known API status without probing the APIs"""
+        cached = self._api_status
+        if cached and time.time() - cached[0] < STATUS_CACHE_TTL:
+            return cached[1], cached[2]
+        return STATUS_NOT_TESTED, STATUS_NOT_TESTED
+    
+    def _probe_apify(self) -> str:
+        """Probe the Apify API and return a status string"""
         try:
-            scraper = ScraperAgent()
-            if scraper.test_apify_connection():
-                apify_status = "✅ Connected"
+            if self.orchestrator.scraper.test_apify_connection():
+                return "✅ Connected"
         except Exception as e:
-            apify_status = f"❌ Error: {str(e)[:50]}..."
-        
+            return f"❌ Error: {str(e)[:50]}..."
+        return "❌ Failed"
+    
+    def _probe_openai(self) -> str:
+        """Probe the OpenAI API and return a status string"""
         try:
-            content_agent = ContentAgent()
-            if content_agent.test_openai_connection():
-                openai_status = "✅ Connected"
+            if self.orchestrator.content_generator.test_openai_connection():
+                return "✅ Connected"
         except Exception as e:
-            openai_status = f"❌ Error: {str(e)[:50]}..."
+            return f"❌ Error: {str(e)[:50]}..."
+        return "❌ Failed"
+    
+    def test_api_connections(self) -> Tuple[str, str]:
+        """Test API connections in parallel and return status"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            apify_future = executor.submit(self._probe_apify)
+            openai_future = executor.submit(self._probe_openai)
+            apify_status = apify_future.result()
+            openai_status = openai_future.result()
         
+        self._api_status = (time.time(), apify_status, openai_status)
         return apify_status, openai_status
     
     def load_profile_image(self, image_url: str) -> Optional[Image.Image]:
         """Load profile image from URL"""
         try:
             if image_url:
-                response = requests.get(image_url, timeout=10)
-                if response.status_code == 200:
-                    return Image.open(BytesIO(response.content))
+                from PIL import Image
+                return Image.open(BytesIO(_fetch_image_bytes(image_url)))
         except Exception as e:
             print(f"Error loading image: {e}")
         return None
     
-    def enhance_linkedin_profile(self, linkedin_url: str, job_description: str = "") -> Tuple[str, str, str, str, str, str, str, str, Optional[Image.Image]]:
-        """Complete LinkedIn profile enhancement with extraction, analysis, and suggestions"""
+    def _format_analysis(self, analysis: Dict[str, Any]) -> Tuple[str, str]:
+        """Format analysis results and keyword analysis as markdown"""
+        parts = [f"""
+## 📊 Analysis Results
+
+**Overall Rating:** {analysis.get('overall_rating', 'Unknown')}
+**Completeness Score:** {analysis.get('completeness_score', 0):.1f}%
+**Job Match Score:** {analysis.get('job_match_score', 0):.1f}%
+
+### 🌟 Strengths
+"""]
+        parts.extend(f"- {strength}\n" for strength in analysis.get('strengths', []))
+        parts.append("\n### ⚠️ Areas for Improvement\n")
+        parts.extend(f"- {weakness}\n" for weakness in analysis.get('weaknesses', []))
+        
+        # Keyword analysis
+        keyword_analysis = analysis.get('keyword_analysis', {})
+        keywords_text = ""
+        if keyword_analysis:
+            found_keywords = keyword_analysis.get('found_keywords', [])
+            missing_keywords = keyword_analysis.get('missing_keywords', [])
+            
+            keywords_text = f"""
+## 🔍 Keyword Analysis
+
+**Found Keywords:** {join_truncated(found_keywords, 10)}
+
+**Missing Keywords:** {join_truncated(missing_keywords, 5)}
+"""
+        
+        return "".join(parts), keywords_text
+    
+    def _format_suggestions(self, suggestions: Dict[str, Any]) -> str:
+        """Format enhancement suggestions as markdown, standard categories before AI content"""
+        standard_parts = []
+        ai_parts = []
+        
+        for category, items in suggestions.items():
+            if category == 'ai_generated_content':
+                ai_content = items if isinstance(items, dict) else {}
+                
+                # AI Headlines
+                if ai_content.get('ai_headlines'):
+                    ai_parts.append("## ✨ Professional Headlines\n\n")
+                    for i, headline in enumerate(ai_content['ai_headlines'], 1):
+                        cleaned_headline = headline.strip('"').replace('\\"', '"')
+                        if cleaned_headline.startswith(('1.', '2.', '3.', '4.', '5.')):
+                            cleaned_headline = cleaned_headline[2:].strip()
+                        ai_parts.append(f"{i}. {cleaned_headline}\n\n")
+                
+                # AI About Section
+                if ai_content.get('ai_about_section'):
+                    ai_parts.append("## 📄 Enhanced About Section\n\n")
+                    ai_parts.append(f"```\n{ai_content['ai_about_section']}\n```\n\n")
+                
+                # AI Experience Descriptions
+                if ai_content.get('ai_experience_descriptions'):
+                    ai_parts.append("## 💼 Experience Description Ideas\n\n")
+                    ai_parts.extend(f"- {desc}\n" for desc in ai_content['ai_experience_descriptions'])
+                    ai_parts.append("\n")
+            else:
+                # Standard categories
+                category_name = category.replace('_', ' ').title()
+                standard_parts.append(f"## 📋 {category_name}\n\n")
+                if isinstance(items, list):
+                    standard_parts.extend(f"- {item}\n" for item in items)
+                else:
+                    standard_parts.append(f"- {items}\n")
+                standard_parts.append("\n")
+        
+        return "".join(standard_parts + ai_parts)
+    
+    async def enhance_linkedin_profile(self, linkedin_url: str, job_description: str = "", force_refresh: bool = False) -> Tuple[str, str, str, str, str, str, str, str, Optional[Image.Image]]:
+        """Complete LinkedIn profile enhancement with extraction, analysis, and suggestions
+
+        Blocking scraper/OpenAI calls run in worker threads so the Gradio
+        event loop stays free to serve other users while they are in flight.
+        """
+        result, session = await self.enhance_profile_session(linkedin_url, job_description, force_refresh)
+        self.current_profile_data, self.current_analysis, self.current_suggestions = session or (None, None, None)
+        return result
+    
+    async def enhance_profile_session(self, linkedin_url: str, job_description: str = "",
+                                      force_refresh: bool = False) -> Tuple[tuple, Optional[Tuple[Dict, Dict, Dict]]]:
+        """
+        Run the enhancement without touching shared instance state
+        
+        Args:
+            linkedin_url (str): LinkedIn profile URL
+            job_description (str): Optional job description for tailored suggestions
+            force_refresh (bool): Re-scrape and ignore cached results
+            
+        Returns:
+            Tuple[tuple, Optional[Tuple[Dict, Dict, Dict]]]: UI outputs, and the
+            (profile, analysis, suggestions) of this run for per-session state
+        """
         if not linkedin_url.strip():
-            return "❌ Error", "Please enter a LinkedIn profile URL", "", "", "", "", "", "", None
+            return ("❌ Error", "Please enter a LinkedIn profile URL", "", "", "", "", "", "", None), None
         
-        if not any(pattern in linkedin_url.lower() for pattern in ['linkedin.com/in/', 'www.linkedin.com/in/']):
-            return "❌ Error", "Please enter a valid LinkedIn profile URL", "", "", "", "", "", "", None
+        if not LINKEDIN_URL_PATTERN.match(linkedin_url.strip()):
+            return ("❌ Error", "Please enter a valid LinkedIn profile URL", "", "", "", "", "", "", None), None
         
+        # Reuse a recent successful result for the same URL and job description
+        cache_key = (
+            linkedin_url.strip().lower(),
+            hashlib.blake2b(job_description.encode('utf-8'), digest_size=8).hexdigest()
+        )
+        cached = self._enhance_cache.get(cache_key)
+        if cached and not force_refresh and time.time() - cached[0] < ENHANCE_CACHE_TTL:
+            _, result, profile_data, analysis, suggestions = cached
+            return result, (profile_data, analysis, suggestions)
+        
+        analysis = None
+        suggestions = None
         try:
             # Step 1: Extract profile data
             self.orchestrator.memory.session_data.clear()
-            profile_data = self.orchestrator.scraper.extract_profile_data(linkedin_url)
-            self.current_profile_data = profile_data
+            # run_in_executor rather than asyncio.to_thread, which needs Python 3.9+
+            loop = asyncio.get_running_loop()
+            profile_data = await loop.run_in_executor(
+                None, self.orchestrator.scraper.extract_profile_data, linkedin_url, force_refresh
+            )
+            
+            # Start the profile image download so it overlaps formatting and analysis
+            image_future = loop.run_in_executor(
+                None,
+                self.load_profile_image,
+                profile_data.get('profile_image_hq') or profile_data.get('profile_image')
+            )
             
             # Format basic info
-            basic_info = f"""
-**Name:** {profile_data.get('name', 'N/A')}
-**Headline:** {profile_data.get('headline', 'N/A')}
-**Location:** {profile_data.get('location', 'N/A')}
-**Connections:** {profile_data.get('connections', 'N/A')}
-**Followers:** {profile_data.get('followers', 'N/A')}
-**Email:** {profile_data.get('email', 'N/A')}
-**Current Job:** {profile_data.get('job_title', 'N/A')} at {profile_data.get('company_name', 'N/A')}
-            """
+            basic_info = BASIC_INFO_TEMPLATE.format_map(ProfileFields(profile_data))
+            
+            experience = profile_data.get('experience') or []
+            education = profile_data.get('education') or []
+            skills = profile_data.get('skills') or []
             
             # Format about section
             about_section = profile_data.get('about', 'No about section available')
             
             # Format experience
-            experience_text = ""
-            for i, exp in enumerate(profile_data.get('experience', [])[:5], 1):
-                experience_text += f"""
+            experience_parts = []
+            for i, exp in enumerate(experience[:5], 1):
+                experience_parts.append(f"""
 **{i}. {exp.get('title', 'Position')}**
 - Company: {exp.get('company', 'N/A')}
 - Duration: {exp.get('duration', 'N/A')}
 - Location: {exp.get('location', 'N/A')}
 - Current: {'Yes' if exp.get('is_current') else 'No'}
-"""
-                if exp.get('description'):
-                    experience_text += f"- Description: {exp.get('description')[:200]}...\n"
-                experience_text += "\n"
+""")
+                description = exp.get('description')
+                if description:
+                    experience_parts.append(f"- Description: {description[:200]}...\n")
+                experience_parts.append("\n")
+            experience_text = "".join(experience_parts)
             
             # Format education and skills
-            education_text = ""
-            for i, edu in enumerate(profile_data.get('education', []), 1):
-                education_text += f"""
+            education_text = "".join(f"""
 **{i}. {edu.get('school', 'School')}**
 - Degree: {edu.get('degree', 'N/A')}
 - Field: {edu.get('field', 'N/A')}
 - Year: {edu.get('year', 'N/A')}
 - Grade: {edu.get('grade', 'N/A')}
 
-"""
-            
-            skills_text = ", ".join(profile_data.get('skills', [])[:20])
-            if len(profile_data.get('skills', [])) > 20:
-                skills_text += f" ... and {len(profile_data.get('skills', [])) - 20} more"
+""" for i, edu in enumerate(education, 1))
             
-            details_text = f"""
-## 🎓 Education
-{education_text if education_text else "No education information available"}
-
-## 🛠️ Skills
-{skills_text if skills_text else "No skills information available"}
-
-## 🏆 Certifications
-{len(profile_data.get('certifications', []))} certifications found
-
-## 📊 Additional Data
-- Projects: {len(profile_data.get('projects', []))}
-- Publications: {len(profile_data.get('publications', []))}
-- Recommendations: {len(profile_data.get('recommendations', []))}
-            """
+            n_skills = len(skills)
+            skills_text = join_truncated(skills, 20, f" ... and {n_skills - 20} more")
             
-            # Load profile image
-            profile_image = self.load_profile_image(profile_data.get('profile_image_hq') or profile_data.get('profile_image'))
+            details_text = DETAILS_TEMPLATE.format(
+                education_text=education_text or "No education information available",
+                skills_text=skills_text or "No skills information available",
+                certifications_count=len(profile_data.get('certifications', [])),
+                projects_count=len(profile_data.get('projects', [])),
+                publications_count=len(profile_data.get('publications', [])),
+                recommendations_count=len(profile_data.get('recommendations', []))
+            )
             
             # Step 2: Analyze profile automatically
             try:
-                analysis = self.orchestrator.analyzer.analyze_profile(
-                    self.current_profile_data, 
+                analysis = await loop.run_in_executor(
+                    None,
+                    self.orchestrator.analyzer.analyze_profile,
+                    profile_data, 
                     job_description
                 )
-                self.current_analysis = analysis
                 
-                # Format analysis results
-                analysis_text = f"""
-## 📊 Analysis Results
-
-**Overall Rating:** {analysis.get('overall_rating', 'Unknown')}
-**Completeness Score:** {analysis.get('completeness_score', 0):.1f}%
-**Job Match Score:** {analysis.get('job_match_score', 0):.1f}%
-
-### 🌟 Strengths
-"""
-                for strength in analysis.get('strengths', []):
-                    analysis_text += f"- {strength}\n"
-                
-                analysis_text += "\n### ⚠️ Areas for Improvement\n"
-                for weakness in analysis.get('weaknesses', []):
-                    analysis_text += f"- {weakness}\n"
-                
-                # Keyword analysis
-                keyword_analysis = analysis.get('keyword_analysis', {})
-                keywords_text = ""
-                if keyword_analysis:
-                    found_keywords = keyword_analysis.get('found_keywords', [])
-                    missing_keywords = keyword_analysis.get('missing_keywords', [])
-                    
-                    keywords_text = f"""
-## 🔍 Keyword Analysis
-
-**Found Keywords:** {', '.join(found_keywords[:10])}
-{"..." if len(found_keywords) > 10 else ""}
-
-**Missing Keywords:** {', '.join(missing_keywords[:5])}
-{"..." if len(missing_keywords) > 5 else ""}
-                    """
+                analysis_text, keywords_text = self._format_analysis(analysis)
             except Exception as e:
+                analysis = None
                 analysis_text = f"⚠️ Analysis failed: {str(e)}"
                 keywords_text = ""
             
-            # Step 3: Generate suggestions automatically
-            try:
-                suggestions = self.orchestrator.content_generator.generate_suggestions(
-                    self.current_analysis, 
-                    job_description
-                )
-                self.current_suggestions = suggestions
-                
-                suggestions_text = ""
-                
-                for category, items in suggestions.items():
-                    if category == 'ai_generated_content':
-                        ai_content = items if isinstance(items, dict) else {}
-                        
-                        # AI Headlines
-                        if 'ai_headlines' in ai_content and ai_content['ai_headlines']:
-                            suggestions_text += "## ✨ Professional Headlines\n\n"
-                            for i, headline in enumerate(ai_content['ai_headlines'], 1):
-                                cleaned_headline = headline.strip('"').replace('\\"', '"')
-                                if cleaned_headline.startswith(('1.', '2.', '3.', '4.', '5.')):
-                                    cleaned_headline = cleaned_headline[2:].strip()
-                                suggestions_text += f"{i}. {cleaned_headline}\n\n"
-                        
-                        # AI About Section
-                        if 'ai_about_section' in ai_content and ai_content['ai_about_section']:
-                            suggestions_text += "## 📄 Enhanced About Section\n\n"
-                            suggestions_text += f"```\n{ai_content['ai_about_section']}\n```\n\n"
-                        
-                        # AI Experience Descriptions
-                        if 'ai_experience_descriptions' in ai_content and ai_content['ai_experience_descriptions']:
-                            suggestions_text += "## 💼 Experience Description Ideas\n\n"
-                            for desc in ai_content['ai_experience_descriptions']:
-                                suggestions_text += f"- {desc}\n"
-                            suggestions_text += "\n"
-                    else:
-                        # Standard categories
-                        category_name = category.replace('_', ' ').title()
-                        suggestions_text += f"## 📋 {category_name}\n\n"
-                        if isinstance(items, list):
-                            for item in items:
-                                suggestions_text += f"- {item}\n"
-                        else:
-                            suggestions_text += f"- {items}\n"
-                        suggestions_text += "\n"
-            except Exception as e:
-                suggestions_text = f"⚠️ Suggestions generation failed: {str(e)}"
+            # Step 3: Generate suggestions automatically (only from this run's analysis)
+            if analysis is None:
+                suggestions_text = "⚠️ Suggestions skipped: profile analysis failed"
+            else:
+                try:
+                    suggestions = await loop.run_in_executor(
+                        None,
+                        self.orchestrator.content_generator.generate_suggestions,
+                        analysis, 
+                        job_description
+                    )
+                    
+                    suggestions_text = self._format_suggestions(suggestions)
+                except Exception as e:
+                    suggestions = None
+                    suggestions_text = f"⚠️ Suggestions generation failed: {str(e)}"
             
-            return "✅ Profile Enhanced Successfully", basic_info, about_section, experience_text, details_text, analysis_text, keywords_text, suggestions_text, profile_image
+            profile_image = await image_future
+            
+            result = ("✅ Profile Enhanced Successfully", basic_info, about_section, experience_text, details_text, analysis_text, keywords_text, suggestions_text, profile_image)
+            
+            # Only cache complete runs, so a transient failure is not replayed for the whole TTL
+            ai_content = suggestions.get('ai_generated_content') if isinstance(suggestions, dict) else None
+            succeeded = (
+                bool(profile_data) and bool(analysis) and bool(suggestions)
+                and not (isinstance(ai_content, dict) and ai_content.get('error'))
+            )
+            if succeeded:
+                # Drop expired entries and remember this run
+                now = time.time()
+                self._enhance_cache = {
+                    key: entry for key, entry in self._enhance_cache.items()
+                    if now - entry[0] < ENHANCE_CACHE_TTL
+                }
+                self._enhance_cache[cache_key] = (now, result, profile_data, analysis, suggestions)
+            
+            return result, (profile_data, analysis, suggestions)
             
         except Exception as e:
-            return "❌ Error", f"Failed to enhance profile: {str(e)}", "", "", "", "", "", "", None
+            return ("❌ Error", f"Failed to enhance profile: {str(e)}", "", "", "", "", "", "", None), None
     
     def analyze_profile(self, job_description: str = "") -> Tuple[str, str, str]:
         """Analyze the extracted profile data"""
@@ -250,39 +488,7 @@ class LinkedInEnhancerGradio:
             )
             self.current_analysis = analysis
             
-            # Format analysis results
-            analysis_text = f"""
-## 📊 Analysis Results
-
-**Overall Rating:** {analysis.get('overall_rating', 'Unknown')}
-**Completeness Score:** {analysis.get('completeness_score', 0):.1f}%
-**Job Match Score:** {analysis.get('job_match_score', 0):.1f}%
-
-### 🌟 Strengths
-"""
-            for strength in analysis.get('strengths', []):
-                analysis_text += f"- {strength}\n"
-            
-            analysis_text += "\n### � Areas for Improvement\n"
-            for weakness in analysis.get('weaknesses', []):
-                analysis_text += f"- {weakness}\n"
-            
-            # Keyword analysis
-            keyword_analysis = analysis.get('keyword_analysis', {})
-            keywords_text = ""
-            if keyword_analysis:
-                found_keywords = keyword_analysis.get('found_keywords', [])
-                missing_keywords = keyword_analysis.get('missing_keywords', [])
-                
-                keywords_text = f"""
-## 🔍 Keyword Analysis
-
-**Found Keywords:** {', '.join(found_keywords[:10])}
-{"..." if len(found_keywords) > 10 else ""}
-
-**Missing Keywords:** {', '.join(missing_keywords[:5])}
-{"..." if len(missing_keywords) > 5 else ""}
-                """
+            analysis_text, keywords_text = self._format_analysis(analysis)
             
             return "✅ Success", analysis_text, keywords_text
             
@@ -302,62 +508,17 @@ class LinkedInEnhancerGradio:
             )
             self.current_suggestions = suggestions
             
-            suggestions_text = ""
-            ai_content_text = ""
-            
-            for category, items in suggestions.items():
-                if category == 'ai_generated_content':
-                    ai_content = items if isinstance(items, dict) else {}
-                    
-                    # AI Headlines
-                    if 'ai_headlines' in ai_content and ai_content['ai_headlines']:
-                        ai_content_text += "## ✨ Professional Headlines\n\n"
-                        for i, headline in enumerate(ai_content['ai_headlines'], 1):
-                            cleaned_headline = headline.strip('"').replace('\\"', '"')
-                            if cleaned_headline.startswith(('1.', '2.', '3.', '4.', '5.')):
-                                cleaned_headline = cleaned_headline[2:].strip()
-                            ai_content_text += f"{i}. {cleaned_headline}\n\n"
-                    
-                    # AI About Section
-                    if 'ai_about_section' in ai_content and ai_content['ai_about_section']:
-                        ai_content_text += "## � Enhanced About Section\n\n"
-                        ai_content_text += f"```\n{ai_content['ai_about_section']}\n```\n\n"
-                    
-                    # AI Experience Descriptions
-                    if 'ai_experience_descriptions' in ai_content and ai_content['ai_experience_descriptions']:
-                        ai_content_text += "## 💼 Experience Description Ideas\n\n"
-                        for desc in ai_content['ai_experience_descriptions']:
-                            ai_content_text += f"- {desc}\n"
-                        ai_content_text += "\n"
-                else:
-                    # Standard categories
-                    category_name = category.replace('_', ' ').title()
-                    suggestions_text += f"## 📋 {category_name}\n\n"
-                    if isinstance(items, list):
-                        for item in items:
-                            suggestions_text += f"- {item}\n"
-                    else:
-                        suggestions_text += f"- {items}\n"
-                    suggestions_text += "\n"
-            
-            return "✅ Success", suggestions_text + ai_content_text
+            return "✅ Success", self._format_suggestions(suggestions)
             
         except Exception as e:
             return "❌ Error", f"Failed to generate suggestions: {str(e)}"
     
-    def export_results(self, linkedin_url: str) -> str:
-        """Export all results to a comprehensive downloadable file"""
-        if not self.current_profile_data:
-            return "❌ No data to export"
+    def _iter_report_sections(self, linkedin_url: str, profile_data: Dict, analysis: Optional[Dict],
+                              suggestions: Optional[Dict]) -> Iterator[str]:
+        """Yield the export report section by section"""
         
-        try:
-            # Create filename with timestamp
-            profile_name = linkedin_url.split('/in/')[-1].split('/')[0] if linkedin_url else 'profile'
-            timestamp = time.strftime('%Y%m%d_%H%M%S')
-            filename = f"LinkedIn_Profile_Enhancement_{profile_name}_{timestamp}.md"
-            
-            # Compile comprehensive report
-            content = f"""# 🚀 LinkedIn Profile Enhancement Report
+        # Header, profile summary and about section
+        yield f"""# 🚀 LinkedIn Profile Enhancement Report
 
 **Generated:** {time.strftime('%B %d, %Y at %I:%M %p')}  
 **Profile URL:** [{linkedin_url}]({linkedin_url})  
@@ -371,24 +532,13 @@ This comprehensive report provides a detailed analysis of your LinkedIn profile
 
 ---
 
-## 👤 Basic Profile Information
-
-| Field | Current Value |
-|-------|---------------|
-| **Name** | {self.current_profile_data.get('name', 'N/A')} |
-| **Professional Headline** | {self.current_profile_data.get('headline', 'N/A')} |
-| **Location** | {self.current_profile_data.get('location', 'N/A')} |
-| **Connections** | {self.current_profile_data.get('connections', 'N/A')} |
-| **Followers** | {self.current_profile_data.get('followers', 'N/A')} |
-| **Email** | {self.current_profile_data.get('email', 'N/A')} |
-| **Current Position** | {self.current_profile_data.get('job_title', 'N/A')} at {self.current_profile_data.get('company_name', 'N/A')} |
-
+{EXPORT_PROFILE_TABLE_TEMPLATE.format_map(ProfileFields(profile_data))}
 ---
 
 ## 📝 Current About Section
 
 ```
-{self.current_profile_data.get('about', 'No about section available')}
+{profile_data.get('about', 'No about section available')}
 ```
 
 ---
@@ -396,9 +546,9 @@ This comprehensive report provides a detailed analysis of your LinkedIn profile
 ## 💼 Professional Experience
 
 """
-            # Add experience details
-            for i, exp in enumerate(self.current_profile_data.get('experience', []), 1):
-                content += f"""
+        # Add experience details
+        for i, exp in enumerate(profile_data.get('experience', []), 1):
+            yield f"""
 ### {i}. {exp.get('title', 'Position')} 
 **Company:** {exp.get('company', 'N/A')}  
 **Duration:** {exp.get('duration', 'N/A')}  
@@ -406,13 +556,14 @@ This comprehensive report provides a detailed analysis of your LinkedIn profile
 **Current Role:** {'Yes' if exp.get('is_current') else 'No'}
 
 """
-                if exp.get('description'):
-                    content += f"**Description:**\n```\n{exp.get('description')}\n```\n\n"
-            
-            # Add education
-            content += "---\n\n## 🎓 Education\n\n"
-            for i, edu in enumerate(self.current_profile_data.get('education', []), 1):
-                content += f"""
+            description = exp.get('description')
+            if description:
+                yield f"**Description:**\n```\n{description}\n```\n\n"
+        
+        # Add education
+        yield "---\n\n## 🎓 Education\n\n"
+        for i, edu in enumerate(profile_data.get('education', []), 1):
+            yield f"""
 ### {i}. {edu.get('school', 'School')}
 - **Degree:** {edu.get('degree', 'N/A')}
 - **Field of Study:** {edu.get('field', 'N/A')}
@@ -420,114 +571,112 @@ This comprehensive report provides a detailed analysis of your LinkedIn profile
 - **Grade:** {edu.get('grade', 'N/A')}
 
 """
-            
-            # Add skills
-            skills = self.current_profile_data.get('skills', [])
-            content += f"""---
+        
+        # Add skills
+        skills = profile_data.get('skills') or []
+        yield f"""---
 
 ## 🛠️ Skills & Expertise
 
 **Total Skills Listed:** {len(skills)}
 
 """
-            if skills:
-                # Group skills for better readability
-                skills_per_line = 5
-                for i in range(0, len(skills), skills_per_line):
-                    skill_group = skills[i:i+skills_per_line]
-                    content += f"- {' • '.join(skill_group)}\n"
-            
-            # Add certifications and additional data
-            content += f"""
+        if skills:
+            # Group skills for better readability
+            skills_per_line = 5
+            for i in range(0, len(skills), skills_per_line):
+                skill_group = skills[i:i+skills_per_line]
+                yield f"- {' • '.join(skill_group)}\n"
+        
+        # Add certifications and additional data
+        yield f"""
 ---
 
 ## 🏆 Additional Profile Data
 
 | Category | Count |
 |----------|-------|
-| **Certifications** | {len(self.current_profile_data.get('certifications', []))} |
-| **Projects** | {len(self.current_profile_data.get('projects', []))} |
-| **Publications** | {len(self.current_profile_data.get('publications', []))} |
-| **Recommendations** | {len(self.current_profile_data.get('recommendations', []))} |
+| **Certifications** | {len(profile_data.get('certifications', []))} |
+| **Projects** | {len(profile_data.get('projects', []))} |
+| **Publications** | {len(profile_data.get('publications', []))} |
+| **Recommendations** | {len(profile_data.get('recommendations', []))} |
 
 """
-            
-            # Add analysis results if available
-            if self.current_analysis:
-                content += f"""---
+        
+        # Add analysis results if available
+        if analysis:
+            yield f"""---
 
 ## 📈 AI Analysis Results
 
 ### Overall Assessment
-- **Overall Rating:** {self.current_analysis.get('overall_rating', 'Unknown')}
-- **Profile Completeness:** {self.current_analysis.get('completeness_score', 0):.1f}%
-- **Job Match Score:** {self.current_analysis.get('job_match_score', 0):.1f}%
+- **Overall Rating:** {analysis.get('overall_rating', 'Unknown')}
+- **Profile Completeness:** {analysis.get('completeness_score', 0):.1f}%
+- **Job Match Score:** {analysis.get('job_match_score', 0):.1f}%
 
 ### 🌟 Identified Strengths
 """
-                for strength in self.current_analysis.get('strengths', []):
-                    content += f"- {strength}\n"
-                
-                content += "\n### ⚠️ Areas for Improvement\n"
-                for weakness in self.current_analysis.get('weaknesses', []):
-                    content += f"- {weakness}\n"
+            for strength in analysis.get('strengths', []):
+                yield f"- {strength}\n"
+            
+            yield "\n### ⚠️ Areas for Improvement\n"
+            for weakness in analysis.get('weaknesses', []):
+                yield f"- {weakness}\n"
+            
+            # Add keyword analysis
+            keyword_analysis = analysis.get('keyword_analysis', {})
+            if keyword_analysis:
+                found_keywords = keyword_analysis.get('found_keywords', [])
+                missing_keywords = keyword_analysis.get('missing_keywords', [])
                 
-                # Add keyword analysis
-                keyword_analysis = self.current_analysis.get('keyword_analysis', {})
-                if keyword_analysis:
-                    found_keywords = keyword_analysis.get('found_keywords', [])
-                    missing_keywords = keyword_analysis.get('missing_keywords', [])
-                    
-                    content += f"""
+                yield f"""
 ### 🔍 Keyword Analysis
 
-**Found Keywords ({len(found_keywords)}):** {', '.join(found_keywords[:15])}
-{"..." if len(found_keywords) > 15 else ""}
+**Found Keywords ({len(found_keywords)}):** {join_truncated(found_keywords, 15)}
 
-**Missing Keywords ({len(missing_keywords)}):** {', '.join(missing_keywords[:10])}
-{"..." if len(missing_keywords) > 10 else ""}
+**Missing Keywords ({len(missing_keywords)}):** {join_truncated(missing_keywords, 10)}
 """
+        
+        # Add enhancement suggestions if available
+        if suggestions:
+            yield "\n---\n\n## 💡 AI-Powered Enhancement Suggestions\n\n"
             
-            # Add enhancement suggestions if available
-            if self.current_suggestions:
-                content += "\n---\n\n## 💡 AI-Powered Enhancement Suggestions\n\n"
-                
-                for category, items in self.current_suggestions.items():
-                    if category == 'ai_generated_content':
-                        ai_content = items if isinstance(items, dict) else {}
-                        
-                        # AI Headlines
-                        if 'ai_headlines' in ai_content and ai_content['ai_headlines']:
-                            content += "### ✨ Professional Headlines (Choose Your Favorite)\n\n"
-                            for i, headline in enumerate(ai_content['ai_headlines'], 1):
-                                cleaned_headline = headline.strip('"').replace('\\"', '"')
-                                if cleaned_headline.startswith(('1.', '2.', '3.', '4.', '5.')):
-                                    cleaned_headline = cleaned_headline[2:].strip()
-                                content += f"{i}. {cleaned_headline}\n\n"
-                        
-                        # AI About Section
-                        if 'ai_about_section' in ai_content and ai_content['ai_about_section']:
-                            content += "### 📄 Enhanced About Section\n\n"
-                            content += f"```\n{ai_content['ai_about_section']}\n```\n\n"
-                        
-                        # AI Experience Descriptions
-                        if 'ai_experience_descriptions' in ai_content and ai_content['ai_experience_descriptions']:
-                            content += "### 💼 Experience Description Enhancements\n\n"
-                            for j, desc in enumerate(ai_content['ai_experience_descriptions'], 1):
-                                content += f"{j}. {desc}\n\n"
+            for category, items in suggestions.items():
+                if category == 'ai_generated_content':
+                    ai_content = items if isinstance(items, dict) else {}
+                    
+                    # AI Headlines
+                    if 'ai_headlines' in ai_content and ai_content['ai_headlines']:
+                        yield "### ✨ Professional Headlines (Choose Your Favorite)\n\n"
+                        for i, headline in enumerate(ai_content['ai_headlines'], 1):
+                            cleaned_headline = headline.strip('"').replace('\\"', '"')
+                            if cleaned_headline.startswith(('1.', '2.', '3.', '4.', '5.')):
+                                cleaned_headline = cleaned_headline[2:].strip()
+                            yield f"{i}. {cleaned_headline}\n\n"
+                    
+                    # AI About Section
+                    if 'ai_about_section' in ai_content and ai_content['ai_about_section']:
+                        yield "### 📄 Enhanced About Section\n\n"
+                        yield f"```\n{ai_content['ai_about_section']}\n```\n\n"
+                    
+                    # AI Experience Descriptions
+                    if 'ai_experience_descriptions' in ai_content and ai_content['ai_experience_descriptions']:
+                        yield "### 💼 Experience Description Enhancements\n\n"
+                        for j, desc in enumerate(ai_content['ai_experience_descriptions'], 1):
+                            yield f"{j}. {desc}\n\n"
+                else:
+                    # Standard categories
+                    category_name = category.replace('_', ' ').title()
+                    yield f"### 📋 {category_name}\n\n"
+                    if isinstance(items, list):
+                        for item in items:
+                            yield f"- {item}\n"
                     else:
-                        # Standard categories
-                        category_name = category.replace('_', ' ').title()
-                        content += f"### 📋 {category_name}\n\n"
-                        if isinstance(items, list):
-                            for item in items:
-                                content += f"- {item}\n"
-                        else:
-                            content += f"- {items}\n"
-                        content += "\n"
-            
-            # Add action items and next steps
-            content += """---
+                        yield f"- {items}\n"
+                    yield "\n"
+        
+        # Add action items and next steps
+        yield """---
 
 ## 🎯 Recommended Action Items
 
@@ -562,10 +711,28 @@ This comprehensive report provides a detailed analysis of your LinkedIn profile
 
 *This is an automated analysis. Results may vary based on individual goals and industry standards.*
 """
+    
+    def export_results(self, linkedin_url: str, session: Optional[Tuple[Dict, Dict, Dict]] = None) -> str:
+        """Export all results to a comprehensive downloadable file
+
+        session is the (profile, analysis, suggestions) of the caller's own run;
+        without it the last run on this instance is exported.
+        """
+        profile_data, analysis, suggestions = session or (
+            self.current_profile_data, self.current_analysis, self.current_suggestions
+        )
+        if not profile_data:
+            return "❌ No data to export"
+        
+        try:
+            # Create filename with timestamp
+            profile_name = linkedin_url.split('/in/')[-1].split('/')[0] if linkedin_url else 'profile'
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
+            filename = f"LinkedIn_Profile_Enhancement_{profile_name}_{timestamp}.md"
             
-            # Save to file (this will be downloaded by the browser)
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Stream sections straight to the file (this will be downloaded by the browser)
+            with open(filename, 'w', encoding='utf-8', buffering=65536) as f:
+                f.writelines(self._iter_report_sections(linkedin_url, profile_data, analysis, suggestions))
             
             return f"✅ Report exported as {filename} - File saved for download"
             
@@ -574,86 +741,22 @@ This comprehensive report provides a detailed analysis of your LinkedIn profile
 
 def create_gradio_interface():
     """Create and return the Gradio interface"""
+    import gradio as gr
     
     app = LinkedInEnhancerGradio()
     
-    # Custom CSS for beautiful styling
-    custom_css = """
-    .gradio-container {
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        max-width: 1200px;
-        margin: 0 auto;
-    }
-    
-    .header-text {
-        text-align: center;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-    }
-    
-    .status-box {
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-    }
-    
-    .success {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        color: #155724;
-    }
-    
-    .error {
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        color: #721c24;
-    }
-    
-    .info {
-        background-color: #e7f3ff;
-        border: 1px solid #b3d7ff;
-        color: #0c5460;
-    }
-    """
-    
-    with gr.Blocks(css=custom_css, title="🚀 LinkedIn Profile Enhancer", theme=gr.themes.Soft()) as demo:
+    with gr.Blocks(css=CUSTOM_CSS, title="🚀 LinkedIn Profile Enhancer", theme=gr.themes.Soft()) as demo:
         
         # Header
-        gr.HTML("""
-        <div class="header-text">
-            <h1>🚀 LinkedIn Profile Enhancer</h1>
-            <p style="font-size: 1.2em; margin: 1rem 0;">AI-powered LinkedIn profile analysis and enhancement suggestions</p>
-            <div style="display: flex; justify-content: center; gap: 2rem; margin-top: 1rem;">
-                <div style="text-align: center;">
-                    <div style="font-size: 2em;">🔍</div>
-                    <div>Real Scraping</div>
-                </div>
-                <div style="text-align: center;">
-                    <div style="font-size: 2em;">🤖</div>
-                    <div>AI Analysis</div>
-                </div>
-                <div style="text-align: center;">
-                    <div style="font-size: 2em;">🎯</div>
-                    <div>Smart Suggestions</div>
-                </div>
-                <div style="text-align: center;">
-                    <div style="font-size: 2em;">📊</div>
-                    <div>Rich Data</div>
-                </div>
-            </div>
-        </div>
-        """)
+        gr.HTML(HEADER_HTML)
         
         # API Status Section
         with gr.Row():
             with gr.Column(scale=1):
                 gr.Markdown("## 🔌 API Status")
                 with gr.Row():
-                    apify_status = gr.Textbox(label="📡 Apify API", interactive=False, value="Testing...")
-                    openai_status = gr.Textbox(label="🤖 OpenAI API", interactive=False, value="Testing...")
+                    apify_status = gr.Textbox(label="📡 Apify API", interactive=False, value=STATUS_NOT_TESTED)
+                    openai_status = gr.Textbox(label="🤖 OpenAI API", interactive=False, value=STATUS_NOT_TESTED)
                 test_btn = gr.Button("🔄 Test Connections", variant="secondary")
         
         # Main Input Section
@@ -669,6 +772,10 @@ def create_gradio_interface():
                     placeholder="Paste the job description here for tailored suggestions...",
                     lines=5
                 )
+                force_refresh = gr.Checkbox(
+                    label="🔄 Force refresh (re-scrape and ignore cached results)",
+                    value=False
+                )
             
             with gr.Column(scale=1):
                 profile_image = gr.Image(
@@ -731,17 +838,22 @@ def create_gradio_interface():
                 **File Format:** Markdown (.md) - Compatible with GitHub, Notion, and most text editors
                 """)
         
+        # Per-browser-session (profile, analysis, suggestions), so concurrent users never share results
+        session_results = gr.State(None)
+        
         # Event Handlers
         def on_test_connections():
             apify, openai = app.test_api_connections()
             return apify, openai
         
-        def on_enhance_profile(url, job_desc):
-            status, basic, about, exp, details, analysis, keywords, suggestions, image = app.enhance_linkedin_profile(url, job_desc)
-            return status, basic, about, exp, details, analysis, keywords, suggestions, image
+        async def on_enhance_profile(url, job_desc, refresh):
+            result, session = await app.enhance_profile_session(url, job_desc, refresh)
+            return (*result, session)
         
-        def on_export_results(url):
-            return app.export_results(url)
+        def on_export_results(url, session):
+            if not session:
+                return "❌ No data to export"
+            return app.export_results(url, session)
         
         # Connect events
         test_btn.click(
@@ -751,29 +863,25 @@ def create_gradio_interface():
         
         enhance_btn.click(
             fn=on_enhance_profile,
-            inputs=[linkedin_url, job_description],
-            outputs=[enhance_status, basic_info, about_section, experience_info, education_skills, analysis_results, keyword_analysis, suggestions_content, profile_image]
+            inputs=[linkedin_url, job_description, force_refresh],
+            outputs=[enhance_status, basic_info, about_section, experience_info, education_skills, analysis_results, keyword_analysis, suggestions_content, profile_image, session_results],
+            concurrency_limit=ENHANCE_CONCURRENCY_LIMIT  # protect Apify/OpenAI rate limits
         )
         
         export_btn.click(
             fn=on_export_results,
-            inputs=[linkedin_url],
+            inputs=[linkedin_url, session_results],
             outputs=[export_status]
         )
         
-        # Auto-test connections on load
+        # Show last-known connection status on load; live probes only run on click
         demo.load(
-            fn=on_test_connections,
+            fn=app.get_cached_api_status,
             outputs=[apify_status, openai_status]
         )
         
         # Footer
-        gr.HTML("""
-        <div style="text-align: center; margin-top: 2rem; padding: 1rem; border-top: 1px solid #eee;">
-            <p>🚀 <strong>LinkedIn Profile Enhancer</strong> | Powered by AI | Built with ❤️ using Gradio</p>
-            <p>Data scraped with respect to LinkedIn's ToS | Uses OpenAI GPT-4o-mini and Apify</p>
-        </div>
-        """)
+        gr.HTML(FOOTER_HTML)
     
     return demo
 
@@ -808,6 +916,8 @@ Web Interface Features:
     print("📱 Launching Gradio interface...")
     
     demo = create_gradio_interface()
+    # Run cheap events in parallel and queue the rest instead of dropping them
+    demo.queue(default_concurrency_limit=4, max_size=32, api_open=False)
     demo.launch(
         server_name="localhost",
         server_port=7860,
@@ -1,4 +1,7 @@
 # Agent Prompts for LinkedIn Profile Enhancer
+from functools import lru_cache
+from string import Formatter
+from typing import Optional, Tuple, Union
 
 class ContentPrompts:
     """Collection of prompts for content generation agents"""
@@ -88,12 +91,24 @@ class ExperiencePrompts:
     Target the experience for: {target_role}
     """    
     ACTION_VERBS = {
-        "Leadership": ["led", "managed", "directed", "coordinated", "supervised"],
-        "Achievement": ["achieved", "delivered", "exceeded", "accomplished", "attained"],
-        "Development": ["developed", "created", "built", "designed", "implemented"],
-        "Improvement": ["optimized", "enhanced", "streamlined", "upgraded", "modernized"],
-        "Problem-solving": ["resolved", "troubleshot", "analyzed", "diagnosed", "solved"]
+        "Leadership": ("led", "managed", "directed", "coordinated", "supervised"),
+        "Achievement": ("achieved", "delivered", "exceeded", "accomplished", "attained"),
+        "Development": ("developed", "created", "built", "designed", "implemented"),
+        "Improvement": ("optimized", "enhanced", "streamlined", "upgraded", "modernized"),
+        "Problem-solving": ("resolved", "troubleshot", "analyzed", "diagnosed", "solved")
     }
+    
+    @classmethod
+    def classify_verb(cls, verb: str) -> Optional[str]:
+        """Return the ACTION_VERBS category for a verb, or None if it is not listed"""
+        return cls._VERB_TO_CATEGORY.get(verb.strip().lower())
+
+# Reverse index so verb lookups are a single dict access
+ExperiencePrompts._VERB_TO_CATEGORY = {
+    verb: category
+    for category, verbs in ExperiencePrompts.ACTION_VERBS.items()
+    for verb in verbs
+}
 
 class GeneralPrompts:
     """General prompts for profile enhancement"""
@@ -214,25 +229,57 @@ class JobMatchingPrompts:
     """
 
 # Utility functions for prompt formatting
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Optional[Tuple[Union[str, Tuple[str, Optional[str], str]], ...]]:
+    """Parse a template once into literal strings and (field, conversion, spec) tuples"""
+    segments = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if literal:
+            segments.append(literal)
+        if field_name is None:
+            continue
+        # Positional, attribute/index and nested-spec fields are left to str.format
+        if not field_name.isidentifier() or '{' in (format_spec or ''):
+            return None
+        segments.append((field_name, conversion, format_spec or ''))
+    return tuple(segments)
+
+_CONVERSIONS = {'r': repr, 's': str, 'a': ascii}
+
 def format_prompt(template: str, **kwargs) -> str:
     """Format prompt template with provided variables"""
     try:
-        return template.format(**kwargs)
+        segments = _compile_template(template)
+        if segments is None:
+            return template.format(**kwargs)
+        
+        parts = []
+        for segment in segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            field_name, conversion, format_spec = segment
+            value = kwargs[field_name]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            parts.append(format(value, format_spec))
+        return "".join(parts)
     except KeyError as e:
         return f"Error formatting prompt: Missing variable {e}"
 
+_PROMPT_CLASSES = {
+    'headline': HeadlinePrompts,
+    'about': AboutPrompts,
+    'experience': ExperiencePrompts,
+    'general': GeneralPrompts,
+    'analysis': AnalysisPrompts,
+    'job_matching': JobMatchingPrompts
+}
+
+@lru_cache(maxsize=128)
 def get_prompt_by_category(category: str, prompt_name: str) -> str:
     """Get a specific prompt by category and name"""
-    prompt_classes = {
-        'headline': HeadlinePrompts(),
-        'about': AboutPrompts(),
-        'experience': ExperiencePrompts(),
-        'general': GeneralPrompts(),
-        'analysis': AnalysisPrompts(),
-        'job_matching': JobMatchingPrompts()
-    }
-    
-    prompt_class = prompt_classes.get(category.lower())
+    prompt_class = _PROMPT_CLASSES.get(category.lower())
     if not prompt_class:
         return f"Category '{category}' not found"
     
@@ -241,3 +288,12 @@ def get_prompt_by_category(category: str, prompt_name: str) -> str:
         return f"Prompt '{prompt_name}' not found in category '{category}'"
     
     return prompt
+
+def _warm_templates() -> None:
+    """Compile the class-level templates so the first format call is cheap"""
+    for prompt_class in _PROMPT_CLASSES.values():
+        for name, value in vars(prompt_class).items():
+            if name.isupper() and isinstance(value, str):
+                _compile_template(value)
+
+_warm_templates()
@@ -1,12 +1,28 @@
 import streamlit as st
 import json
-import pandas as pd
+import hashlib
+import re
 from agents.orchestrator import ProfileOrchestrator
-from agents.scraper_agent import ScraperAgent
-from agents.content_agent import ContentAgent
-import plotly.express as px
-import plotly.graph_objects as go
+from utils.validators import LINKEDIN_URL_PATTERN
 from datetime import datetime
+from pathlib import Path
+
+STYLES_PATH = Path(__file__).with_name('styles.css')
+
+
+# Leading "1."-style numbering that the model sometimes adds to generated headlines
+NUMBERED_PREFIX_PATTERN = re.compile(r'^\s*\d+\.\s*')
+
+# Card wrappers pre-split into literal prefix/suffix so only the body varies per render
+CARD_TEMPLATES = {
+    kind: (f'<div class="{kind}-card">', '</div>')
+    for kind in ('info', 'success', 'warning', 'metric')
+}
+
+def _card(kind: str, body: str) -> str:
+    """Wrap body in one of the styled card divs"""
+    prefix, suffix = CARD_TEMPLATES[kind]
+    return f"{prefix}{body}{suffix}"
 
 # Configure Streamlit page
 st.set_page_config(
@@ -17,67 +33,20 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    .metric-card {
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #667eea;
-        margin: 0.5rem 0;
-    }
-    
-    .success-card {
-        background: #d4edda;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #28a745;
-        margin: 0.5rem 0;
-    }
-    
-    .warning-card {
-        background: #fff3cd;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #ffc107;
-        margin: 0.5rem 0;
-    }
-    
-    .info-card {
-        background: #e7f3ff;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #17a2b8;
-        margin: 0.5rem 0;
-    }
-    
-    .stTabs > div > div > div > div {
-        padding: 1rem;
-    }
-    
-    .profile-section {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def _load_css():
+    """Read the stylesheet from disk once per server process"""
+    return f"<style>\n{STYLES_PATH.read_text(encoding='utf-8')}</style>"
+
+st.markdown(_load_css(), unsafe_allow_html=True)
+
+@st.cache_resource
+def _get_orchestrator():
+    """Share a single ProfileOrchestrator across all sessions and reruns"""
+    return ProfileOrchestrator()
 
 def initialize_session_state():
     """Initialize session state variables"""
-    if 'orchestrator' not in st.session_state:
-        st.session_state.orchestrator = ProfileOrchestrator()
     if 'analysis_results' not in st.session_state:
         st.session_state.analysis_results = None
     if 'profile_data' not in st.session_state:
@@ -94,9 +63,47 @@ def clear_results_if_url_changed(linkedin_url):
         st.session_state.profile_data = None
         st.session_state.suggestions = None
         st.session_state.current_url = linkedin_url
-        st.cache_data.clear()  # Clear any Streamlit cache
         print(f"🔄 URL changed to: {linkedin_url} - Clearing cached data")
 
+def _cache_key(data, job_description):
+    """Hash canonical JSON of data plus the job description into a cache key"""
+    payload = json.dumps(data, sort_keys=True, default=str) + "||" + (job_description or "")
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+# Arguments prefixed with an underscore are skipped by Streamlit's hasher, so the
+# explicit content hash is the only thing that decides a cache hit
+@st.cache_data(show_spinner=False, ttl=3600)
+def _cached_analyze(cache_key, _profile_data, job_description):
+    """Analyze a profile, reusing results for identical profile and job description"""
+    return _get_orchestrator().analyzer.analyze_profile(_profile_data, job_description)
+
+class _UncachedResult(Exception):
+    """Carries a result out of a cached function; Streamlit never caches a raised call"""
+    
+    def __init__(self, result):
+        super().__init__("result not cached")
+        self.result = result
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _cached_suggest_or_raise(cache_key, _analysis, job_description):
+    """Generate suggestions, raising _UncachedResult when the AI step failed"""
+    suggestions = _get_orchestrator().content_generator.generate_suggestions(_analysis, job_description)
+    ai_content = suggestions.get('ai_generated_content')
+    if isinstance(ai_content, dict) and ai_content.get('error'):
+        raise _UncachedResult(suggestions)
+    return suggestions
+
+def _cached_suggest(cache_key, analysis, job_description):
+    """Generate suggestions, reusing results for identical analysis and job description
+
+    Results with an AI generation error are returned but not cached, so a
+    temporary OpenAI outage is retried on the next run instead of for an hour.
+    """
+    try:
+        return _cached_suggest_or_raise(cache_key, analysis, job_description)
+    except _UncachedResult as e:
+        return e.result
+
 def create_header():
     """Create the main header"""
     st.markdown("""
@@ -144,6 +151,12 @@ def create_sidebar():
             help="Include job description for personalized optimization"
         )
         
+        force_refresh = st.checkbox(
+            "🔄 Force refresh (re-scrape instead of using the cached profile)",
+            value=False,
+            help="Scraped profiles are cached on disk for 24 hours"
+        )
+        
         # API Status
         st.subheader("🔌 API Status")
         
@@ -152,8 +165,7 @@ def create_sidebar():
             with st.spinner("Testing API connections..."):
                 # Test Apify
                 try:
-                    scraper = ScraperAgent()
-                    apify_status = scraper.test_apify_connection()
+                    apify_status = _get_orchestrator().scraper.test_apify_connection()
                     if apify_status:
                         st.success("✅ Apify: Connected")
                     else:
@@ -163,8 +175,7 @@ def create_sidebar():
                 
                 # Test OpenAI
                 try:
-                    content_agent = ContentAgent()
-                    openai_status = content_agent.test_openai_connection()
+                    openai_status = _get_orchestrator().content_generator.test_openai_connection()
                     if openai_status:
                         st.success("✅ OpenAI: Connected")
                     else:
@@ -183,21 +194,25 @@ def create_sidebar():
             if st.button(f"📋 {url.split('/')[-1]}", key=url):
                 st.session_state.example_url = url
         
-        return linkedin_url, job_description
+        return linkedin_url, job_description, force_refresh
 
 def create_metrics_display(analysis):
     """Create metrics display"""
+    completeness = float(analysis.get('completeness_score') or 0)
+    rating = analysis.get('overall_rating') or 'Unknown'
+    job_match = float(analysis.get('job_match_score') or 0)
+    found_keywords = (analysis.get('keyword_analysis') or {}).get('found_keywords') or ()
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric(
             "📈 Completeness Score",
-            f"{analysis.get('completeness_score', 0):.1f}%",
+            f"{completeness:.1f}%",
             delta=None
         )
     
     with col2:
-        rating = analysis.get('overall_rating', 'Unknown')
         st.metric(
             "⭐ Overall Rating",
             rating,
@@ -207,70 +222,81 @@ def create_metrics_display(analysis):
     with col3:
         st.metric(
             "🎯 Job Match Score",
-            f"{analysis.get('job_match_score', 0):.1f}%",
+            f"{job_match:.1f}%",
             delta=None
         )
     
     with col4:
-        keywords = analysis.get('keyword_analysis', {})
-        found_count = len(keywords.get('found_keywords', []))
         st.metric(
             "🔍 Keywords Found",
-            found_count,
+            len(found_keywords),
             delta=None
         )
 
+@st.cache_resource
+def _static_weights_pie():
+    """Build the constant profile section weights pie chart once"""
+    import plotly.express as px
+    
+    scores = {
+        'Profile Info': 20,
+        'About Section': 25,
+        'Experience': 25,
+        'Skills': 15,
+        'Education': 15
+    }
+    
+    fig_pie = px.pie(
+        values=list(scores.values()),
+        names=list(scores.keys()),
+        title="Profile Section Weights",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig_pie.update_layout(height=400)
+    return fig_pie
+
+@st.cache_data(show_spinner=False)
+def _gauge(current_score: float):
+    """Build the completeness gauge for a given score"""
+    import plotly.graph_objects as go
+    
+    target_score = 90
+    
+    fig_gauge = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = current_score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Profile Completeness"},
+        delta = {'reference': target_score, 'increasing': {'color': "green"}},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 50], 'color': "lightgray"},
+                {'range': [50, 80], 'color': "gray"},
+                {'range': [80, 100], 'color': "lightgreen"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    fig_gauge.update_layout(height=400)
+    return fig_gauge
+
 def create_analysis_charts(analysis):
     """Create analysis charts"""
     col1, col2 = st.columns(2)
     
     with col1:
         # Completeness breakdown
-        scores = {
-            'Profile Info': 20,
-            'About Section': 25,
-            'Experience': 25,
-            'Skills': 15,
-            'Education': 15
-        }
-        
-        fig_pie = px.pie(
-            values=list(scores.values()),
-            names=list(scores.keys()),
-            title="Profile Section Weights",
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        fig_pie.update_layout(height=400)
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(_static_weights_pie(), use_container_width=True)
     
     with col2:
         # Score comparison
-        current_score = analysis.get('completeness_score', 0)
-        target_score = 90
-        
-        fig_gauge = go.Figure(go.Indicator(
-            mode = "gauge+number+delta",
-            value = current_score,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': "Profile Completeness"},
-            delta = {'reference': target_score, 'increasing': {'color': "green"}},
-            gauge = {
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "darkblue"},
-                'steps': [
-                    {'range': [0, 50], 'color': "lightgray"},
-                    {'range': [50, 80], 'color': "gray"},
-                    {'range': [80, 100], 'color': "lightgreen"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-        fig_gauge.update_layout(height=400)
-        st.plotly_chart(fig_gauge, use_container_width=True)
+        st.plotly_chart(_gauge(analysis.get('completeness_score', 0)), use_container_width=True)
 
 def display_profile_data(profile_data):
     """Display scraped profile data in a structured format"""
@@ -320,52 +346,53 @@ def display_profile_data(profile_data):
         """, unsafe_allow_html=True)
     
     # About Section
-    if profile_data.get('about'):
+    about = profile_data.get('about')
+    if about:
         st.subheader("📝 About Section")
         st.markdown(f"""
         <div class="profile-section">
-            {profile_data.get('about', 'No about section available')}
+            {about}
         </div>
         """, unsafe_allow_html=True)
     
     # Experience
-    if profile_data.get('experience'):
+    experience = profile_data.get('experience') or []
+    if experience:
         st.subheader("💼 Experience")
-        for i, exp in enumerate(profile_data.get('experience', [])):
-            with st.expander(f"{exp.get('title', 'Position')} at {exp.get('company', 'Company')}", expanded=i==0):
+        for i, exp in enumerate(experience):
+            exp_get = exp.get
+            with st.expander(f"{exp_get('title', 'Position')} at {exp_get('company', 'Company')}", expanded=i==0):
                 col1, col2 = st.columns([2, 1])
                 with col1:
-                    st.write(f"**Duration:** {exp.get('duration', 'N/A')}")
-                    st.write(f"**Location:** {exp.get('location', 'N/A')}")
-                    if exp.get('description'):
+                    st.write(f"**Duration:** {exp_get('duration', 'N/A')}")
+                    st.write(f"**Location:** {exp_get('location', 'N/A')}")
+                    description = exp_get('description')
+                    if description:
                         st.write("**Description:**")
-                        st.write(exp.get('description'))
+                        st.write(description)
                 with col2:
-                    st.write(f"**Current Role:** {'Yes' if exp.get('is_current') else 'No'}")
+                    st.write(f"**Current Role:** {'Yes' if exp_get('is_current') else 'No'}")
     
     # Skills
-    if profile_data.get('skills'):
+    skills = profile_data.get('skills') or []
+    if skills:
         st.subheader("🛠️ Skills")
-        skills = profile_data.get('skills', [])
-        if skills:
-            # Create a DataFrame for better display
-            skills_df = pd.DataFrame({'Skills': skills})
-            st.dataframe(skills_df, use_container_width=True)
+        st.markdown("- " + "\n- ".join(skills))
     
     # Education
-    if profile_data.get('education'):
+    education = profile_data.get('education') or []
+    if education:
         st.subheader("🎓 Education")
-        for edu in profile_data.get('education', []):
-            st.markdown(f"""
-            <div class="info-card">
-                <strong>{edu.get('degree', 'Degree')}</strong><br>
-                {edu.get('school', 'School')} | {edu.get('field', 'Field')}<br>
-                <em>{edu.get('year', 'Year')}</em>
-            </div>
-            """, unsafe_allow_html=True)
+        education_cards = [
+            _card('info', f"<strong>{edu.get('degree', 'Degree')}</strong><br>"
+                          f"{edu.get('school', 'School')} | {edu.get('field', 'Field')}<br>"
+                          f"<em>{edu.get('year', 'Year')}</em>")
+            for edu in education
+        ]
+        st.markdown("".join(education_cards), unsafe_allow_html=True)
     
-    # Raw Data (collapsible)
-    with st.expander("🔍 Raw JSON Data"):
+    # Raw Data (only serialized when requested; expander bodies run on every rerun)
+    if st.checkbox("🔍 Show Raw JSON Data", value=False):
         st.json(profile_data)
 
 def display_analysis_results(analysis):
@@ -388,12 +415,7 @@ def display_analysis_results(analysis):
         st.subheader("🌟 Profile Strengths")
         strengths = analysis.get('strengths', [])
         if strengths:
-            for strength in strengths:
-                st.markdown(f"""
-                <div class="success-card">
-                    ✅ {strength}
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown("".join(_card('success', f"✅ {strength}") for strength in strengths), unsafe_allow_html=True)
         else:
             st.info("No specific strengths identified")
     
@@ -401,12 +423,7 @@ def display_analysis_results(analysis):
         st.subheader("🔧 Areas for Improvement")
         weaknesses = analysis.get('weaknesses', [])
         if weaknesses:
-            for weakness in weaknesses:
-                st.markdown(f"""
-                <div class="warning-card">
-                    🔸 {weakness}
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown("".join(_card('warning', f"🔸 {weakness}") for weakness in weaknesses), unsafe_allow_html=True)
         else:
             st.success("No major areas for improvement identified")
     
@@ -469,9 +486,7 @@ def generate_suggestions_markdown(suggestions, profile_data=None):
             if 'ai_headlines' in ai_content and ai_content['ai_headlines']:
                 markdown_content += "### ✨ Professional Headlines\n\n"
                 for i, headline in enumerate(ai_content['ai_headlines'], 1):
-                    cleaned_headline = headline.strip('"').replace('\\"', '"')
-                    if cleaned_headline.startswith(('1.', '2.', '3.', '4.', '5.')):
-                        cleaned_headline = cleaned_headline[2:].strip()
+                    cleaned_headline = NUMBERED_PREFIX_PATTERN.sub("", headline.strip().strip('"').replace('\\"', '"'))
                     markdown_content += f"{i}. {cleaned_headline}\n"
                 markdown_content += "\n"
             
@@ -582,9 +597,7 @@ def display_suggestions(suggestions):
             if 'ai_headlines' in ai_content and ai_content['ai_headlines']:
                 st.write("**✨ Professional Headlines:**")
                 for i, headline in enumerate(ai_content['ai_headlines'], 1):
-                    cleaned_headline = headline.strip('"').replace('\\"', '"')
-                    if cleaned_headline.startswith(('1.', '2.', '3.', '4.', '5.')):
-                        cleaned_headline = cleaned_headline[2:].strip()
+                    cleaned_headline = NUMBERED_PREFIX_PATTERN.sub("", headline.strip().strip('"').replace('\\"', '"'))
                     st.write(f"{i}. {cleaned_headline}")
                 st.write("")
             
@@ -617,39 +630,43 @@ def main():
     create_header()
     
     # Sidebar
-    linkedin_url, job_description = create_sidebar()
+    linkedin_url, job_description, force_refresh = create_sidebar()
     
     # Main content
     if st.button("🚀 Enhance Profile", type="primary", use_container_width=True):
         if not linkedin_url.strip():
             st.error("Please enter a LinkedIn profile URL")
-        elif not any(pattern in linkedin_url.lower() for pattern in ['linkedin.com/in/', 'www.linkedin.com/in/']):
+        elif not LINKEDIN_URL_PATTERN.match(linkedin_url.strip()):
             st.error("Please enter a valid LinkedIn profile URL")
         else:
             # Clear cached data if URL has changed
             clear_results_if_url_changed(linkedin_url)
             
-            with st.spinner("🔍 Analyzing LinkedIn profile..."):
-                try:
-                    st.info(f"🔍 Extracting data from: {linkedin_url}")
-                    
-                    # Get profile data and analysis (force fresh extraction)
-                    profile_data = st.session_state.orchestrator.scraper.extract_profile_data(linkedin_url)
-                    
-                    st.info(f"✅ Profile data extracted for: {profile_data.get('name', 'Unknown')}")
-                    
-                    analysis = st.session_state.orchestrator.analyzer.analyze_profile(profile_data, job_description)
-                    suggestions = st.session_state.orchestrator.content_generator.generate_suggestions(analysis, job_description)
-                    
-                    # Store in session state
-                    st.session_state.profile_data = profile_data
-                    st.session_state.analysis_results = analysis
-                    st.session_state.suggestions = suggestions
-                    
-                    st.success("✅ Profile analysis completed!")
-                    
-                except Exception as e:
-                    st.error(f"❌ Error analyzing profile: {str(e)}")
+            try:
+                st.info(f"🔍 Extracting data from: {linkedin_url}")
+                
+                # Each stage depends on the previous one; the three AI completions
+                # inside generate_suggestions are already issued concurrently
+                with st.spinner("🔍 Scraping LinkedIn profile..."):
+                    profile_data = _get_orchestrator().scraper.extract_profile_data(linkedin_url, force_refresh=force_refresh)
+                
+                st.info(f"✅ Profile data extracted for: {profile_data.get('name', 'Unknown')}")
+                
+                with st.spinner("📊 Analyzing profile..."):
+                    analysis = _cached_analyze(_cache_key(profile_data, job_description), profile_data, job_description)
+                
+                with st.spinner("🤖 Generating suggestions..."):
+                    suggestions = _cached_suggest(_cache_key(analysis, job_description), analysis, job_description)
+                
+                # Store in session state
+                st.session_state.profile_data = profile_data
+                st.session_state.analysis_results = analysis
+                st.session_state.suggestions = suggestions
+                
+                st.success("✅ Profile analysis completed!")
+                
+            except Exception as e:
+                st.error(f"❌ Error analyzing profile: {str(e)}")
     
     # Display results if available
     if st.session_state.profile_data or st.session_state.analysis_results:
@@ -685,12 +702,11 @@ def main():
                 recommendations = st.session_state.analysis_results.get('recommendations', [])
                 if recommendations:
                     st.subheader("🎯 Priority Actions")
-                    for i, rec in enumerate(recommendations[:5], 1):
-                        st.markdown(f"""
-                        <div class="metric-card">
-                            <strong>{i}.</strong> {rec}
-                        </div>
-                        """, unsafe_allow_html=True)
+                    action_cards = [
+                        _card('metric', f"<strong>{i}.</strong> {rec}")
+                        for i, rec in enumerate(recommendations[:5], 1)
+                    ]
+                    st.markdown("".join(action_cards), unsafe_allow_html=True)
                 
                 st.subheader("📊 General Best Practices")
                 best_practices = [
@@ -701,12 +717,8 @@ def main():
                     "Monitor profile views and connection requests"
                 ]
                 
-                for practice in best_practices:
-                    st.markdown(f"""
-                    <div class="info-card">
-                        🔸 {practice}
-                    </div>
-                    """, unsafe_allow_html=True)
+                practice_cards = [_card('info', f"🔸 {practice}") for practice in best_practices]
+                st.markdown("".join(practice_cards), unsafe_allow_html=True)
             else:
                 st.info("Complete the analysis first to see implementation suggestions")
     
@@ -0,0 +1,8 @@
+# Test configuration
+import os
+import sys
+
+# Make the project packages importable however pytest is invoked
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
@@ -0,0 +1,73 @@
+# Tests for the OpenAI Batch API helpers of ContentAgent
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from agents.content_agent import ContentAgent
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """ContentAgent wired to a mocked OpenAI client"""
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    agent = ContentAgent()
+    agent.openai_client = MagicMock()
+    return agent
+
+
+def _output_line(custom_id, content, status_code=200):
+    return orjson.dumps({
+        'custom_id': custom_id,
+        'response': {
+            'status_code': status_code,
+            'body': {'choices': [{'message': {'content': content, 'refusal': None if content else 'refused'}}]}
+        }
+    }).decode()
+
+
+def test_submit_batch_uploads_one_request_per_prompt(agent):
+    client = agent.openai_client
+    client.files.create.return_value = SimpleNamespace(id='file-1')
+    client.batches.create.return_value = SimpleNamespace(id='batch-1')
+    
+    batch_id = agent.submit_batch({'headline': 'Write a headline', 'about': 'Write an about section'})
+    
+    assert batch_id == 'batch-1'
+    _, payload = client.files.create.call_args.kwargs['file']
+    requests = [orjson.loads(line) for line in payload.splitlines()]
+    assert [request['custom_id'] for request in requests] == ['headline', 'about']
+    assert requests[0]['body']['messages'][0]['content'] == 'Write a headline'
+    assert client.batches.create.call_args.kwargs['input_file_id'] == 'file-1'
+
+
+def test_submit_batch_without_client_returns_none(agent):
+    agent.openai_client = None
+    assert agent.submit_batch({'headline': 'Write a headline'}) is None
+
+
+def test_wait_for_batch_polls_and_skips_bad_lines(agent):
+    client = agent.openai_client
+    client.batches.retrieve.side_effect = [
+        SimpleNamespace(status='in_progress', output_file_id=None),
+        SimpleNamespace(status='completed', output_file_id='out-1'),
+    ]
+    client.files.content.return_value = SimpleNamespace(text='\n'.join([
+        _output_line('ok', '  Hello  '),
+        _output_line('refused', None),
+        _output_line('failed', 'ignored', status_code=500),
+        '{not json',
+        orjson.dumps({'custom_id': 'no-choices', 'response': {'status_code': 200, 'body': {}}}).decode(),
+        '',
+    ]))
+    
+    results = agent.wait_for_batch('batch-1', poll_interval=0)
+    
+    assert results == {'ok': 'Hello'}
+    assert client.batches.retrieve.call_count == 2
+
+
+def test_wait_for_batch_returns_empty_on_failed_batch(agent):
+    agent.openai_client.batches.retrieve.return_value = SimpleNamespace(status='failed', output_file_id=None)
+    assert agent.wait_for_batch('batch-1', poll_interval=0) == {}
@@ -0,0 +1,42 @@
+# Tests for JobMatcher batch scoring
+import numpy as np
+import pytest
+
+from utils.job_matcher import JobMatcher
+
+PROFILE = {
+    'name': 'Jane Doe',
+    'headline': 'Senior Python engineer',
+    'skills': ['Python', 'Django', 'AWS', 'Docker'],
+    'experience': [{'title': 'Backend Engineer', 'description': 'Built Python services on AWS'}],
+    'education': [{'degree': 'BSc', 'field': 'Computer Science'}],
+}
+
+JOBS = [
+    'Looking for a Python developer with AWS and Docker, 3+ years experience',
+    'Marketing manager with SEO and social media skills',
+    'Full stack engineer: React, Node.js, SQL and Kubernetes',
+]
+
+
+def test_score_batch_matches_individual_scores():
+    matcher = JobMatcher()
+    
+    scores = matcher.score_batch(PROFILE, JOBS)
+    
+    expected = [matcher.calculate_match_score(PROFILE, job)['overall_score'] for job in JOBS]
+    assert scores.shape == (len(JOBS),)
+    assert scores == pytest.approx(expected, abs=0.01)
+
+
+def test_score_batch_with_no_jobs_is_empty():
+    assert JobMatcher().score_batch(PROFILE, []).shape == (0,)
+
+
+def test_top_k_jobs_returns_best_first():
+    matcher = JobMatcher()
+    scores = np.array([40.0, 90.0, 10.0, 75.0], dtype=np.float32)
+    
+    assert matcher.top_k_jobs(scores, 2).tolist() == [1, 3]
+    assert matcher.top_k_jobs(scores, 10).tolist() == [1, 3, 0, 2]
+    assert matcher.top_k_jobs(scores, 0).tolist() == []
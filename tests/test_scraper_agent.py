@@ -0,0 +1,58 @@
+# Tests for ScraperAgent.batch_extract
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+import requests
+
+from agents.scraper_agent import ScraperAgent
+
+
+@pytest.fixture
+def agent(monkeypatch, tmp_path):
+    """ScraperAgent with a throwaway profile cache and a mocked HTTP session"""
+    monkeypatch.setenv('APIFY_API_TOKEN', 'apify_api_test')
+    monkeypatch.setenv('PROFILE_CACHE_PATH', str(tmp_path / 'profiles.sqlite3'))
+    agent = ScraperAgent()
+    agent._session = MagicMock()
+    return agent
+
+
+def _apify_response(items, status_code=200):
+    return SimpleNamespace(status_code=status_code, content=orjson.dumps(items), text='')
+
+
+def test_batch_extract_scrapes_in_one_run_and_matches_results(agent):
+    agent._session.post.return_value = _apify_response([
+        {'fullName': 'Bar', 'publicIdentifier': 'bar'},
+        {'fullName': 'Foo', 'linkedinUrl': 'https://www.linkedin.com/in/foo/'},
+    ])
+    
+    results = agent.batch_extract([
+        'https://www.linkedin.com/in/foo',
+        'linkedin.com/in/bar',
+        'https://www.linkedin.com/in/missing',
+    ])
+    
+    assert agent._session.post.call_count == 1
+    assert len(agent._session.post.call_args.kwargs['json']['profileUrls']) == 3
+    assert results['https://www.linkedin.com/in/foo']['name'] == 'Foo'
+    assert results['https://linkedin.com/in/bar']['name'] == 'Bar'
+    assert 'https://www.linkedin.com/in/missing' not in results
+
+
+def test_batch_extract_serves_cached_profiles_without_scraping(agent):
+    agent.profile_cache.set('https://www.linkedin.com/in/foo', {'name': 'Foo', 'url': 'https://www.linkedin.com/in/foo'})
+    
+    results = agent.batch_extract(['https://www.linkedin.com/in/foo'])
+    
+    assert results['https://www.linkedin.com/in/foo']['name'] == 'Foo'
+    agent._session.post.assert_not_called()
+
+
+def test_batch_extract_raises_on_api_error(agent):
+    agent._session.post.return_value = _apify_response([], status_code=500)
+    
+    with pytest.raises(requests.RequestException):
+        agent.batch_extract(['https://www.linkedin.com/in/foo'])
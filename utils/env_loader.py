@@ -0,0 +1,8 @@
+# Environment Loading
+from functools import lru_cache
+from dotenv import load_dotenv
+
+@lru_cache(maxsize=None)
+def ensure_env_loaded() -> bool:
+    """Parse the .env file once per process, however many modules ask for it"""
+    return load_dotenv()
@@ -1,7 +1,164 @@
 # Job Matching Logic
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, FrozenSet, Optional, NamedTuple
+import os
 import re
+import math
+import stat
+import hashlib
+import tempfile
+from pathlib import Path
 from collections import Counter
+from functools import lru_cache
+import numpy as np
+import orjson
+
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator; keyword matching falls back to substring checks
+    ahocorasick = None
+
+# Patterns used to parse job descriptions, compiled once at import
+SKILL_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\b(python|javascript|java|react|angular|node\.?js|sql|aws|docker|kubernetes)\b',
+        r'\b(machine learning|ai|data science|devops|full.?stack)\b',
+        r'\b(project management|agile|scrum|leadership)\b'
+    )
+]
+EXP_RE = re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience', re.IGNORECASE)
+WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+STOP_WORDS = frozenset({'the', 'and', 'for', 'with', 'you', 'will', 'are', 'have'})
+
+# Optional on-disk cache of parsed job requirements, shared across processes.
+# Disabled unless JOB_CACHE_DIR is set; it should point at a private directory.
+JOB_CACHE_DIR = Path(os.environ['JOB_CACHE_DIR']) if os.getenv('JOB_CACHE_DIR') else None
+JOB_CACHE_MAX_ENTRIES = int(os.getenv('JOB_CACHE_MAX_ENTRIES', '512'))
+
+@lru_cache(maxsize=128)
+def _lower_skills(skills: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercase a profile's skills once so repeated job comparisons reuse the set"""
+    return frozenset(skill.lower() for skill in skills)
+
+class JobRequirements(NamedTuple):
+    """Immutable parse of a job description, safe to share between cache hits"""
+    skills: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    experience_years: int
+
+def _parse_job_description(job_description: str) -> JobRequirements:
+    """Run the regex passes over a job description"""
+    # Extract skills (common technical skills), de-duplicated in first-occurrence order per pattern
+    skills = dict.fromkeys(
+        match.group(1).lower()
+        for skill_re in SKILL_RES
+        for match in skill_re.finditer(job_description)
+    )
+    
+    # Extract experience years
+    exp_match = EXP_RE.search(job_description)
+    experience_years = int(exp_match.group(1)) if exp_match else 0
+    
+    # Extract keywords (all meaningful words), de-duplicated in first-occurrence order
+    # so the [:10]/[:5] slices taken by the scorers are the same in every process
+    keywords = dict.fromkeys(
+        word_lower for word in WORD_RE.findall(job_description)
+        if (word_lower := word.lower()) not in STOP_WORDS
+    )
+    
+    return JobRequirements(tuple(skills), tuple(keywords), experience_years)
+
+@lru_cache(maxsize=32)
+def _build_kw_automaton(keywords: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton over lowercased keywords, reused across profiles"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+def _job_cache_key(job_description: str) -> str:
+    """Stable on-disk key for a job description"""
+    return hashlib.blake2b(job_description.encode('utf-8'), digest_size=16).hexdigest()
+
+def _job_cache_dir() -> Optional[Path]:
+    """The job cache directory, or None when disabled or not private to this user"""
+    if JOB_CACHE_DIR is None:
+        return None
+    
+    try:
+        JOB_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = JOB_CACHE_DIR.stat()
+    except OSError as e:
+        print(f"⚠️ Job cache disabled, cannot use {JOB_CACHE_DIR}: {e}")
+        return None
+    
+    # Refuse directories another user could have planted or can write into
+    if (hasattr(os, 'getuid') and st.st_uid != os.getuid()) or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        print(f"⚠️ Job cache disabled, {JOB_CACHE_DIR} is not private to this user")
+        return None
+    return JOB_CACHE_DIR
+
+def _read_job_cache(cache_dir: Path, key: str) -> Optional[JobRequirements]:
+    """Parsed requirements stored under key, or None on a miss or malformed entry"""
+    cache_path = cache_dir / f"{key}.json"
+    try:
+        with open(cache_path, 'rb') as f:
+            data = orjson.loads(f.read())
+        requirements = JobRequirements(
+            tuple(str(skill) for skill in data['skills']),
+            tuple(str(keyword) for keyword in data['keywords']),
+            int(data['experience_years'])
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        print(f"⚠️ Ignoring unreadable job cache entry {cache_path.name}: {e}")
+        return None
+    return requirements
+
+def _write_job_cache(cache_dir: Path, key: str, requirements: JobRequirements) -> None:
+    """Store parsed requirements under key, then evict the oldest entries beyond the cap"""
+    # Unique temp file per writer (process and thread), renamed into place so readers never see a partial entry
+    tmp_name = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix='.tmp', delete=False) as f:
+            tmp_name = f.name
+            f.write(orjson.dumps(requirements._asdict()))
+        os.replace(tmp_name, cache_dir / f"{key}.json")
+    except OSError as e:
+        print(f"⚠️ Could not persist job cache entry: {e}")
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+        return
+    
+    try:
+        entries = sorted(cache_dir.glob('*.json'), key=lambda path: path.stat().st_mtime)
+        for stale_path in entries[:max(len(entries) - JOB_CACHE_MAX_ENTRIES, 0)]:
+            stale_path.unlink()
+    except OSError as e:
+        print(f"⚠️ Could not prune job cache: {e}")
+
+@lru_cache(maxsize=256)
+def _load_prepared_job(job_description: str) -> Tuple[JobRequirements, Any]:
+    """Return parsed requirements and keyword automaton, reading requirements from disk when cached"""
+    cache_dir = _job_cache_dir()
+    key = _job_cache_key(job_description)
+    
+    requirements = _read_job_cache(cache_dir, key) if cache_dir is not None else None
+    if requirements is None:
+        requirements = _parse_job_description(job_description)
+        if cache_dir is not None:
+            _write_job_cache(cache_dir, key, requirements)
+    
+    # The automaton is rebuilt rather than stored, so nothing executable is read from disk
+    automaton = None
+    if ahocorasick is not None and requirements.keywords:
+        automaton = _build_kw_automaton(tuple(sorted(requirements.keywords)))
+    
+    return requirements, automaton
 
 class JobMatcher:
     """Utility class for matching LinkedIn profiles with job descriptions"""
@@ -13,6 +170,13 @@ class JobMatcher:
             'keywords': 0.2,
             'education': 0.1
         }
+        # Weights in subscore order, so scoring avoids four dict lookups per call
+        self._weights = (
+            self.weight_config['skills'],
+            self.weight_config['experience'],
+            self.weight_config['keywords'],
+            self.weight_config['education']
+        )
         
         self.skill_synonyms = {
             'javascript': ['js', 'ecmascript', 'node.js', 'nodejs'],
@@ -22,48 +186,43 @@ class JobMatcher:
             'machine learning': ['ml', 'ai', 'artificial intelligence'],
             'database': ['db', 'sql', 'mysql', 'postgresql', 'mongodb']
         }
+        
+        # Inverted index so every synonym resolves to its canonical skill in one lookup
+        self._syn_to_canon = {
+            synonym: canonical
+            for canonical, synonyms in self.skill_synonyms.items()
+            for synonym in (canonical, *synonyms)
+        }
+        # Bounded per-instance cache of each profile's canonical skill set
+        self._profile_canon_skills = lru_cache(maxsize=128)(self._build_profile_canon_skills)
     
-    def calculate_match_score(self, profile_data: Dict[str, Any], job_description: str) -> Dict[str, Any]:
+    def calculate_match_score(self, profile_data: Dict[str, Any], job_description: str,
+                              profile_text: Optional[str] = None) -> Dict[str, Any]:
         """
         Calculate comprehensive match score between profile and job
         
         Args:
             profile_data (Dict[str, Any]): Cleaned profile data
             job_description (str): Job description text
+            profile_text (Optional[str]): Precomputed flatten_profile_text() result,
+                reused when scoring one profile against several jobs
             
         Returns:
             Dict[str, Any]: Match analysis with scores and details
         """
         job_requirements = self._parse_job_requirements(job_description)
-        
-        # Calculate individual scores
-        skills_score = self._calculate_skills_match(
-            profile_data.get('skills', []), 
-            job_requirements['skills']
-        )
-        
-        experience_score = self._calculate_experience_match(
-            profile_data.get('experience', []), 
-            job_requirements
-        )
-        
-        keywords_score = self._calculate_keywords_match(
-            profile_data, 
-            job_requirements['keywords']
-        )
-        
-        education_score = self._calculate_education_match(
-            profile_data.get('education', []), 
-            job_requirements
+        skills_score, experience_score, keywords_score, education_score = self._calculate_subscores(
+            profile_data, job_description, job_requirements, profile_text
         )
         
         # Calculate weighted overall score
-        overall_score = (
-            skills_score['score'] * self.weight_config['skills'] +
-            experience_score['score'] * self.weight_config['experience'] +
-            keywords_score['score'] * self.weight_config['keywords'] +
-            education_score['score'] * self.weight_config['education']
+        subscores = (
+            skills_score['score'],
+            experience_score['score'],
+            keywords_score['score'],
+            education_score['score']
         )
+        overall_score = math.fsum(score * weight for score, weight in zip(subscores, self._weights))
         
         return {
             'overall_score': round(overall_score, 2),
@@ -79,6 +238,98 @@ class JobMatcher:
             'job_requirements': job_requirements
         }
     
+    def _calculate_subscores(self, profile_data: Dict[str, Any], job_description: str,
+                             job_requirements: Dict[str, Any],
+                             profile_text: Optional[str]) -> Tuple[Dict, Dict, Dict, Dict]:
+        """Skills, experience, keywords and education matches, in weight_config order"""
+        keyword_automaton = _load_prepared_job(job_description)[1]
+        return (
+            self._calculate_skills_match(profile_data.get('skills', []), job_requirements['skills']),
+            self._calculate_experience_match(profile_data.get('experience', []), job_requirements),
+            self._calculate_keywords_match(
+                profile_data, job_requirements['keywords'], profile_text, keyword_automaton
+            ),
+            self._calculate_education_match(profile_data.get('education', []), job_requirements)
+        )
+    
+    def score_profile_against_jobs(self, profile_data: Dict[str, Any],
+                                   job_descriptions: List[str]) -> List[Dict[str, Any]]:
+        """
+        Score one profile against several job descriptions
+        
+        Args:
+            profile_data (Dict[str, Any]): Cleaned profile data
+            job_descriptions (List[str]): Job description texts
+            
+        Returns:
+            List[Dict[str, Any]]: Match analyses in the same order as job_descriptions
+        """
+        # Scoring is pure-Python CPU work, so threads would only contend for the GIL;
+        # the win is flattening the profile once instead of once per job
+        profile_text = self.flatten_profile_text(profile_data)
+        return [
+            self.calculate_match_score(profile_data, job_description, profile_text)
+            for job_description in job_descriptions
+        ]
+    
+    def score_batch(self, profile_data: Dict[str, Any], job_descriptions: List[str]) -> np.ndarray:
+        """
+        Compute overall match scores for one profile against many jobs
+        
+        Args:
+            profile_data (Dict[str, Any]): Cleaned profile data
+            job_descriptions (List[str]): Job description texts
+            
+        Returns:
+            np.ndarray: Overall score per job, in the same order as job_descriptions
+        """
+        profile_text = self.flatten_profile_text(profile_data)
+        
+        # (N, 4) subscore matrix in weight_config order, reduced with a single matrix-vector product
+        subscores = np.empty((len(job_descriptions), 4), dtype=np.float64)
+        for row, job_description in enumerate(job_descriptions):
+            job_requirements = self._parse_job_requirements(job_description)
+            subscores[row] = [
+                match['score']
+                for match in self._calculate_subscores(profile_data, job_description, job_requirements, profile_text)
+            ]
+        
+        return subscores @ np.array(self._weights, dtype=np.float64)
+    
+    def top_k_jobs(self, scores: np.ndarray, k: int) -> np.ndarray:
+        """
+        Return indices of the k highest scores, best first
+        
+        Args:
+            scores (np.ndarray): Scores from score_batch
+            k (int): Number of jobs to return
+            
+        Returns:
+            np.ndarray: Job indices sorted by descending score
+        """
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        
+        # argpartition selects the top k in O(N); only those k are sorted
+        top = np.argpartition(scores, -k)[-k:]
+        return top[np.argsort(scores[top])[::-1]]
+    
+    def prepare_job(self, job_description: str) -> str:
+        """
+        Parse a job description and build its keyword automaton ahead of scoring
+        
+        Requirements are also written to the disk cache when JOB_CACHE_DIR is set.
+        
+        Args:
+            job_description (str): Job description text
+            
+        Returns:
+            str: Cache key of the prepared job (its file name under JOB_CACHE_DIR, when enabled)
+        """
+        _load_prepared_job(job_description)
+        return _job_cache_key(job_description)
+    
     def find_skill_gaps(self, profile_skills: List[str], job_requirements: List[str]) -> Dict[str, List[str]]:
         """
         Identify skill gaps between profile and job requirements
@@ -90,27 +341,24 @@ class JobMatcher:
         Returns:
             Dict[str, List[str]]: Missing and matching skills
         """
-        profile_skills_lower = [skill.lower() for skill in profile_skills]
+        profile_skills_key = tuple(profile_skills)
+        profile_skills_lower = _lower_skills(profile_skills_key)
+        profile_canon_skills = self._profile_canon_skills(profile_skills_key)
         job_skills_lower = [skill.lower() for skill in job_requirements]
         
-        # Find exact matches
         matching_skills = []
         missing_skills = []
         
         for job_skill in job_skills_lower:
-            if job_skill in profile_skills_lower:
+            # Exact and synonym matches are a single lookup on canonical skill names
+            if self._canon(job_skill) in profile_canon_skills:
+                matching_skills.append(job_skill)
+            # Fall back to partial matches only on a miss
+            elif any(job_skill in profile_skill or profile_skill in job_skill
+                     for profile_skill in profile_skills_lower):
                 matching_skills.append(job_skill)
             else:
-                # Check for synonyms
-                found_synonym = False
-                for profile_skill in profile_skills_lower:
-                    if self._are_skills_similar(profile_skill, job_skill):
-                        matching_skills.append(job_skill)
-                        found_synonym = True
-                        break
-                
-                if not found_synonym:
-                    missing_skills.append(job_skill)
+                missing_skills.append(job_skill)
         
         return {
             'matching_skills': matching_skills,
@@ -128,81 +376,67 @@ class JobMatcher:
         Returns:
             List[str]: Improvement suggestions
         """
-        suggestions = []
         breakdown = match_analysis['breakdown']
+        skills, experience, keywords, education = (
+            breakdown[key] for key in ('skills', 'experience', 'keywords', 'education')
+        )
+        missing_skills = skills['details'].get('missing_skills', [])[:3]
+        
+        rules = [
+            # Skills suggestions
+            (skills['score'] < 70 and missing_skills,
+             f"Add these high-priority skills: {', '.join(missing_skills)}"),
+            # Experience suggestions
+            (experience['score'] < 60,
+             "Highlight more relevant experience in your current/previous roles"),
+            (experience['score'] < 60,
+             "Add quantified achievements that demonstrate impact"),
+            # Keywords suggestions
+            (keywords['score'] < 50,
+             "Incorporate more industry-specific keywords throughout your profile"),
+            # Education suggestions
+            (education['score'] < 40,
+             "Consider adding relevant certifications or courses")
+        ]
         
-        # Skills suggestions
-        if breakdown['skills']['score'] < 70:
-            missing_skills = breakdown['skills']['details']['missing_skills'][:3]
-            if missing_skills:
-                suggestions.append(
-                    f"Add these high-priority skills: {', '.join(missing_skills)}"
-                )
-        
-        # Experience suggestions
-        if breakdown['experience']['score'] < 60:
-            suggestions.append(
-                "Highlight more relevant experience in your current/previous roles"
-            )
-            suggestions.append(
-                "Add quantified achievements that demonstrate impact"
-            )
-        
-        # Keywords suggestions
-        if breakdown['keywords']['score'] < 50:
-            suggestions.append(
-                "Incorporate more industry-specific keywords throughout your profile"
-            )
-        
-        # Education suggestions
-        if breakdown['education']['score'] < 40:
-            suggestions.append(
-                "Consider adding relevant certifications or courses"
-            )
-        
-        return suggestions
+        return [message for condition, message in rules if condition]
+    
+    def flatten_profile_text(self, profile_data: Dict[str, Any]) -> str:
+        """
+        Join all string and list values of a profile into one lowercased text blob
+        
+        Args:
+            profile_data (Dict[str, Any]): Cleaned profile data
+            
+        Returns:
+            str: Lowercased profile text used for keyword matching
+        """
+        parts = []
+        for value in profile_data.values():
+            if isinstance(value, str):
+                parts.append(value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict):
+                        parts.append(' '.join(str(v) for v in item.values()))
+                    else:
+                        parts.append(str(item))
+        
+        return ' '.join(parts).lower()
     
     def _parse_job_requirements(self, job_description: str) -> Dict[str, Any]:
         """Parse job description to extract requirements"""
-        requirements = {
-            'skills': [],
-            'keywords': [],
-            'experience_years': 0,
+        parsed = _load_prepared_job(job_description)[0]
+        
+        # Fresh dict each call since callers receive it in their match results
+        return {
+            'skills': list(parsed.skills),
+            'keywords': list(parsed.keywords),
+            'experience_years': parsed.experience_years,
             'education_level': '',
             'industry': '',
             'role_type': ''
         }
-        
-        # Extract skills (common technical skills)
-        skill_patterns = [
-            r'\b(python|javascript|java|react|angular|node\.?js|sql|aws|docker|kubernetes)\b',
-            r'\b(machine learning|ai|data science|devops|full.?stack)\b',
-            r'\b(project management|agile|scrum|leadership)\b'
-        ]
-        
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
-            requirements['skills'].extend([match.lower() for match in matches])
-        
-        # Extract experience years
-        exp_pattern = r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'
-        exp_matches = re.findall(exp_pattern, job_description, re.IGNORECASE)
-        if exp_matches:
-            requirements['experience_years'] = int(exp_matches[0])
-        
-        # Extract keywords (all meaningful words)
-        keywords = re.findall(r'\b[a-zA-Z]{3,}\b', job_description)
-        stop_words = {'the', 'and', 'for', 'with', 'you', 'will', 'are', 'have'}
-        requirements['keywords'] = [
-            word.lower() for word in keywords 
-            if word.lower() not in stop_words
-        ]
-        
-        # Remove duplicates
-        requirements['skills'] = list(set(requirements['skills']))
-        requirements['keywords'] = list(set(requirements['keywords']))
-        
-        return requirements
     
     def _calculate_skills_match(self, profile_skills: List[str], job_skills: List[str]) -> Dict[str, Any]:
         """Calculate skills match score"""
@@ -228,17 +462,18 @@ class JobMatcher:
         # Calculate total years of experience
         total_years = 0
         relevant_roles = 0
+        top_keywords = frozenset(job_requirements.get('keywords', [])[:10])
         
         for exp in profile_experience:
             duration_info = exp.get('duration_info', {})
             if duration_info.get('duration_months'):
                 total_years += duration_info['duration_months'] / 12
             
-            # Check if role is relevant (simple keyword matching)
+            # Check if role is relevant (whole-word keyword matching)
             role_text = f"{exp.get('title', '')} {exp.get('description', '')}".lower()
-            job_keywords = job_requirements.get('keywords', [])
+            role_tokens = set(WORD_RE.findall(role_text))
             
-            if any(keyword in role_text for keyword in job_keywords[:10]):
+            if top_keywords & role_tokens:
                 relevant_roles += 1
         
         details['total_experience'] = round(total_years, 1)
@@ -256,30 +491,28 @@ class JobMatcher:
             'details': details
         }
     
-    def _calculate_keywords_match(self, profile_data: Dict, job_keywords: List[str]) -> Dict[str, Any]:
+    def _calculate_keywords_match(self, profile_data: Dict, job_keywords: List[str],
+                                  profile_text: Optional[str] = None, automaton: Any = None) -> Dict[str, Any]:
         """Calculate keywords match score"""
         if not job_keywords:
             return {'score': 100, 'details': {'matched': 0, 'total': 0}}
         
-        # Extract all text from profile
-        profile_text = ""
-        for key, value in profile_data.items():
-            if isinstance(value, str):
-                profile_text += f" {value}"
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        profile_text += f" {' '.join(str(v) for v in item.values())}"
-                    else:
-                        profile_text += f" {item}"
-        
-        profile_text = profile_text.lower()
+        if profile_text is None:
+            profile_text = self.flatten_profile_text(profile_data)
         
         # Count keyword matches
-        matched_keywords = 0
-        for keyword in job_keywords:
-            if keyword.lower() in profile_text:
-                matched_keywords += 1
+        keywords_lower = [keyword.lower() for keyword in job_keywords]
+        if ahocorasick is not None:
+            # One linear pass over the profile text finds every keyword occurrence
+            unique_keywords = tuple(sorted(set(keywords_lower) - {''}))
+            found = {''}  # An empty keyword is trivially contained, as with the substring fallback
+            if unique_keywords:
+                if automaton is None:
+                    automaton = _build_kw_automaton(unique_keywords)
+                found.update(keyword for _, keyword in automaton.iter(profile_text))
+            matched_keywords = sum(1 for keyword in keywords_lower if keyword in found)
+        else:
+            matched_keywords = sum(1 for keyword in keywords_lower if keyword in profile_text)
         
         score = (matched_keywords / len(job_keywords)) * 100
         
@@ -316,22 +549,13 @@ class JobMatcher:
             'details': details
         }
     
-    def _are_skills_similar(self, skill1: str, skill2: str) -> bool:
-        """Check if two skills are similar using synonyms"""
-        skill1_lower = skill1.lower()
-        skill2_lower = skill2.lower()
-        
-        # Check direct synonyms
-        for main_skill, synonyms in self.skill_synonyms.items():
-            if ((skill1_lower == main_skill or skill1_lower in synonyms) and
-                (skill2_lower == main_skill or skill2_lower in synonyms)):
-                return True
-        
-        # Check partial matches
-        if skill1_lower in skill2_lower or skill2_lower in skill1_lower:
-            return True
-        
-        return False
+    def _build_profile_canon_skills(self, profile_skills: Tuple[str, ...]) -> FrozenSet[str]:
+        """Canonical skill names for a profile, cached per skills tuple"""
+        return frozenset(self._canon(skill) for skill in _lower_skills(profile_skills))
+    
+    def _canon(self, skill_lower: str) -> str:
+        """Map a lowercased skill to its canonical synonym group name"""
+        return self._syn_to_canon.get(skill_lower, skill_lower)
     
     def _generate_match_recommendations(self, skills_score: Dict, experience_score: Dict, 
                                       keywords_score: Dict, education_score: Dict) -> List[str]:
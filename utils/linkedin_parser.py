@@ -1,8 +1,134 @@
 # LinkedIn Data Parser
 import re
-from typing import Dict, Any, List, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, lru_cache, partial
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator; skill categorization falls back to substring checks
+    ahocorasick = None
+
+# Common stop words excluded from extracted keywords
+STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'between', 'among', 'within', 'without',
+    'under', 'over', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
+    'her', 'us', 'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
+})
+
+# Patterns compiled once and reused on every parse
+_RE_PUNCT = re.compile(r'[^\w\s\-.,!?()&/]')
+_RE_KW_CLEAN = re.compile(r'[^\w\s]')
+_RE_YEAR = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Lowercases and blanks punctuation in one C pass; only valid for ASCII text
+_ASCII_KW_TABLE = str.maketrans({
+    code: ' ' if _RE_KW_CLEAN.match(chr(code)) else chr(code).lower()
+    for code in range(128)
+})
+
+# Achievements are sentences containing a number/metric. Splitting on '.' first
+# and searching each sentence keeps matching linear; avoid reintroducing
+# [^.]* on both sides of a metric, which backtracks quadratically on long input.
+# Every metric alternative also needs a non-digit right after \d+, so the digit
+# run never has to give characters back.
+_RE_SENT = re.compile(r'[^.]+')
+_RE_METRIC = re.compile(
+    r'\b\d+(?:'
+    r'%'  # Percentage achievements
+    r'|[km]\+?'  # Numbers with K (thousands) or M (millions)
+    r'|\s*(?:years?|months?)'  # Time periods
+    r')'
+    r'|\$\d+',  # Money amounts
+    re.IGNORECASE
+)
+
+# Free-text fields cleaned as-is, in output order
+PROFILE_TEXT_FIELDS = ('name', 'headline', 'location', 'about')
+EXPERIENCE_TEXT_FIELDS = ('title', 'company', 'duration', 'description', 'location')
+EDUCATION_TEXT_FIELDS = ('degree', 'school', 'year', 'field')
+
+# Below this many profiles, process start-up costs more than parallel cleaning saves
+PARALLEL_MIN_PROFILES = 256
+
+# Cleaned strings shorter than this are interned so repeats across profiles share one object
+INTERN_MAX_LENGTH = 128
+
+@lru_cache(maxsize=8192)
+def _clean_text_cached(text: str) -> str:
+    """Clean text once per distinct input; fields like company and location repeat a lot"""
+    # Remove extra whitespace (split() uses the same whitespace class as regex \s)
+    text = ' '.join(text.split())
+    
+    # Remove special characters but keep basic punctuation
+    text = _RE_PUNCT.sub('', text)
+    
+    return sys.intern(text) if len(text) < INTERN_MAX_LENGTH else text
+
+@lru_cache(maxsize=4096)
+def _parse_years(duration_str: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Current-position flag plus start/end years for a duration string"""
+    years = _RE_YEAR.findall(duration_str)
+    return (
+        'present' in duration_str.lower(),
+        years[0] if len(years) > 0 else None,
+        years[1] if len(years) > 1 else None
+    )
+
+@lru_cache(maxsize=1024)
+def _first_number(text: str) -> int:
+    """First run of digits in text, scanned by hand (connection strings are short)"""
+    i, n = 0, len(text)
+    while i < n and not text[i].isdecimal():
+        i += 1
+    if i == n:
+        return 0
+    
+    j = i
+    while j < n and text[j].isdecimal():
+        j += 1
+    return int(text[i:j])
+
+class TextView:
+    """Sentence and keyword-token splits of one text, each computed at most once and shared by the extractors"""
+    
+    def __init__(self, text: str):
+        self.text = text
+    
+    @cached_property
+    def sentences(self) -> Tuple[str, ...]:
+        """Period-delimited sentences, as used by extract_achievements"""
+        return tuple(_RE_SENT.findall(self.text))
+    
+    @cached_property
+    def tokens(self) -> Tuple[str, ...]:
+        """Lowercased words with punctuation removed, as used by extract_keywords"""
+        if self.text.isascii():
+            return tuple(self.text.translate(_ASCII_KW_TABLE).split())
+        return tuple(_RE_KW_CLEAN.sub(' ', self.text.lower()).split())
+
+@lru_cache(maxsize=1024)
+def _text_view(text: str) -> TextView:
+    """Shared view per distinct text"""
+    return TextView(text)
+
+def clear_text_caches() -> None:
+    """
+    Release the memoized cleaning results (the shared string pool)
+    
+    Long-running batch jobs can call this between batches so strings from
+    earlier profiles are no longer kept alive by the caches.
+    """
+    for cached in (_clean_text_cached, _parse_years, _first_number, _text_view):
+        cached.cache_clear()
+
 class LinkedInParser:
     """Utility class for parsing and cleaning LinkedIn profile data"""
     
@@ -13,24 +139,24 @@ class LinkedInParser:
             'marketing': ['seo', 'social media', 'content marketing', 'digital marketing', 'analytics'],
             'design': ['ui/ux', 'photoshop', 'figma', 'adobe', 'design thinking']
         }
+        self._category_names = list(self.skill_categories)
+        self._skill_automaton = self._build_skill_automaton()
     
-    def clean_profile_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+    def clean_profile_data(self, raw_data: Dict[str, Any], parsed_at: Optional[str] = None) -> Dict[str, Any]:
         """
         Clean and standardize raw profile data
         
         Args:
             raw_data (Dict[str, Any]): Raw scraped data
+            parsed_at (Optional[str]): ISO timestamp to record; defaults to now
             
         Returns:
             Dict[str, Any]: Cleaned profile data
         """
-        cleaned_data = {}
+        clean_text = self._clean_text
         
         # Clean basic info
-        cleaned_data['name'] = self._clean_text(raw_data.get('name', ''))
-        cleaned_data['headline'] = self._clean_text(raw_data.get('headline', ''))
-        cleaned_data['location'] = self._clean_text(raw_data.get('location', ''))
-        cleaned_data['about'] = self._clean_text(raw_data.get('about', ''))
+        cleaned_data = {field: clean_text(raw_data.get(field, '')) for field in PROFILE_TEXT_FIELDS}
         
         # Clean experience
         cleaned_data['experience'] = self._clean_experience_list(
@@ -43,7 +169,7 @@ class LinkedInParser:
         )
         
         # Clean and categorize skills
-        cleaned_data['skills'] = self._clean_skills_list(
+        cleaned_data['skills'], cleaned_data['skill_categories'] = self._clean_skills_list(
             raw_data.get('skills', [])
         )
         
@@ -53,54 +179,80 @@ class LinkedInParser:
         )
         
         cleaned_data['url'] = raw_data.get('url', '')
-        cleaned_data['parsed_at'] = datetime.now().isoformat()
+        cleaned_data['parsed_at'] = parsed_at or datetime.now().isoformat()
         
         return cleaned_data
     
-    def extract_keywords(self, text: str, min_length: int = 3) -> List[str]:
+    def clean_profile_batch(self, raw_list: List[Dict[str, Any]],
+                            max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Extract meaningful keywords from text
+        Clean many raw profiles in one call
+        
+        Repeated field values across the batch (companies, schools, skills)
+        are cleaned once and then served from the text cache.
+        
+        Args:
+            raw_list (List[Dict[str, Any]]): Raw scraped profiles
+            max_workers (Optional[int]): Worker processes to shard large batches across;
+                None cleans serially in this process
+        
+        Returns:
+            List[Dict[str, Any]]: Cleaned profiles, in input order
+        """
+        # One timestamp for the whole batch
+        clean = partial(self.clean_profile_data, parsed_at=datetime.now().isoformat())
+        
+        if max_workers is None or max_workers < 2 or len(raw_list) < PARALLEL_MIN_PROFILES:
+            return [clean(raw_data) for raw_data in raw_list]
+        
+        # Cleaning is CPU-bound Python, so processes (not threads) are needed to use more cores
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(clean, raw_list, chunksize=32))
+    
+    def analyze_text(self, text: str) -> TextView:
+        """
+        Split text once for reuse across extract_keywords and extract_achievements
         
         Args:
             text (str): Input text
+            
+        Returns:
+            TextView: Lazily computed sentences and keyword tokens for the text
+        """
+        return _text_view(text)
+    
+    def extract_keywords(self, text: Union[str, TextView], min_length: int = 3) -> List[str]:
+        """
+        Extract meaningful keywords from text
+        
+        Args:
+            text (Union[str, TextView]): Input text, or a view from analyze_text
             min_length (int): Minimum keyword length
             
         Returns:
             List[str]: Extracted keywords
         """
-        # Remove special characters and convert to lowercase
-        clean_text = re.sub(r'[^\w\s]', ' ', text.lower())
-        
-        # Split into words and filter
-        words = clean_text.split()
-        
-        # Common stop words to exclude
-        stop_words = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
-            'after', 'above', 'below', 'between', 'among', 'within', 'without',
-            'under', 'over', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
-            'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
-            'her', 'us', 'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
-        }
-        
-        # Filter keywords
-        keywords = [
-            word for word in words 
-            if len(word) >= min_length and word not in stop_words
-        ]
-        
-        # Remove duplicates while preserving order
-        unique_keywords = []
-        seen = set()
-        for keyword in keywords:
-            if keyword not in seen:
-                unique_keywords.append(keyword)
-                seen.add(keyword)
+        return list(self.iter_keywords(text, min_length))
+    
+    def iter_keywords(self, text: Union[str, TextView], min_length: int = 3) -> Iterator[str]:
+        """
+        Yield meaningful keywords from text without building a list
         
-        return unique_keywords
+        Args:
+            text (Union[str, TextView]): Input text, or a view from analyze_text
+            min_length (int): Minimum keyword length
+            
+        Returns:
+            Iterator[str]: Keywords in first-occurrence order
+        """
+        view = text if isinstance(text, TextView) else _text_view(text)
+        
+        # Dedupe in C first (dict keys keep insertion order) so the Python-level
+        # filter only visits each distinct word once, however long the text.
+        # Kept keywords are interned so repeats across profiles share one string.
+        for word in dict.fromkeys(view.tokens):
+            if len(word) >= min_length and word not in STOP_WORDS:
+                yield sys.intern(word)
     
     def parse_duration(self, duration_str: str) -> Dict[str, Any]:
         """
@@ -123,17 +275,11 @@ class LinkedInParser:
         if not duration_str:
             return duration_info
         
-        # Check if current position
-        if 'present' in duration_str.lower():
-            duration_info['is_current'] = True
-        
-        # Extract years using regex
-        year_pattern = r'\b(19|20)\d{2}\b'
-        years = re.findall(year_pattern, duration_str)
-        
-        if years:
-            duration_info['start_date'] = years[0] if len(years) > 0 else None
-            duration_info['end_date'] = years[1] if len(years) > 1 else None
+        # Current flag and years are cached per string; the dict stays fresh per call
+        is_current, start_date, end_date = _parse_years(duration_str)
+        duration_info['is_current'] = is_current
+        duration_info['start_date'] = start_date
+        duration_info['end_date'] = end_date
         
         return duration_info
     
@@ -147,117 +293,129 @@ class LinkedInParser:
         Returns:
             Dict[str, List[str]]: Categorized skills
         """
-        categorized = {
-            'technical': [],
-            'management': [],
-            'marketing': [],
-            'design': [],
-            'other': []
-        }
+        categorized = self._empty_skill_categories()
         
         for skill in skills:
-            skill_lower = skill.lower()
-            categorized_flag = False
-            
-            for category, keywords in self.skill_categories.items():
-                if any(keyword in skill_lower for keyword in keywords):
-                    categorized[category].append(skill)
-                    categorized_flag = True
-                    break
-            
-            if not categorized_flag:
-                categorized['other'].append(skill)
+            categorized[self._skill_category(skill.lower())].append(skill)
         
         return categorized
     
-    def extract_achievements(self, text: str) -> List[str]:
+    def extract_achievements(self, text: Union[str, TextView]) -> List[str]:
         """
         Extract achievements with numbers/metrics from text
         
         Args:
-            text (str): Input text
+            text (Union[str, TextView]): Input text, or a view from analyze_text
             
         Returns:
             List[str]: List of achievements
         """
-        achievements = []
-        
-        # Patterns for achievements with numbers
-        patterns = [
-            r'[^.]*\b\d+%[^.]*',  # Percentage achievements
-            r'[^.]*\b\d+[kK]\+?[^.]*',  # Numbers with K (thousands)
-            r'[^.]*\b\d+[mM]\+?[^.]*',  # Numbers with M (millions)
-            r'[^.]*\$\d+[^.]*',  # Money amounts
-            r'[^.]*\b\d+\s*(years?|months?)[^.]*',  # Time periods
-        ]
+        return list(self.iter_achievements(text))
+    
+    def iter_achievements(self, text: Union[str, TextView]) -> Iterator[str]:
+        """
+        Yield achievements with numbers/metrics from text without building a list
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            achievements.extend([match.strip() for match in matches])
+        Args:
+            text (Union[str, TextView]): Input text, or a view from analyze_text
+            
+        Returns:
+            Iterator[str]: Achievement sentences in text order
+        """
+        view = text if isinstance(text, TextView) else _text_view(text)
         
-        return achievements
+        for sentence in view.sentences:
+            if _RE_METRIC.search(sentence):
+                yield sentence.strip()
+    
+    def _empty_skill_categories(self) -> Dict[str, List[str]]:
+        """Fresh category buckets for categorized skills"""
+        return {
+            'technical': [],
+            'management': [],
+            'marketing': [],
+            'design': [],
+            'other': []
+        }
+    
+    def _skill_category(self, skill_lower: str) -> str:
+        """Category of a lowercased skill; the first matching category wins"""
+        if self._skill_automaton is not None:
+            # One pass over the skill finds every keyword; the lowest category index wins
+            hits = [index for _, index in self._skill_automaton.iter(skill_lower)]
+            return self._category_names[min(hits)] if hits else 'other'
+        
+        for category, keywords in self.skill_categories.items():
+            if any(keyword in skill_lower for keyword in keywords):
+                return category
+        
+        return 'other'
+    
+    def _build_skill_automaton(self):
+        """Build an Aho-Corasick automaton mapping each category keyword to its category index"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for index, keywords in enumerate(self.skill_categories.values()):
+            for keyword in keywords:
+                # Keep the first category a keyword appears in
+                if keyword not in automaton:
+                    automaton.add_word(keyword, index)
+        automaton.make_automaton()
+        return automaton
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\-.,!?()&/]', '', text)
-        
-        return text
+        return _clean_text_cached(text)
     
     def _clean_experience_list(self, experience_list: List[Dict]) -> List[Dict]:
         """Clean experience entries"""
         cleaned_experience = []
         
+        # Bind hot methods once instead of looking them up per entry
+        clean_text = self._clean_text
+        parse_duration = self.parse_duration
+        extract_achievements = self.extract_achievements
+        analyze_text = self.analyze_text
+        
         for exp in experience_list:
-            if isinstance(exp, dict):
-                cleaned_exp = {
-                    'title': self._clean_text(exp.get('title', '')),
-                    'company': self._clean_text(exp.get('company', '')),
-                    'duration': self._clean_text(exp.get('duration', '')),
-                    'description': self._clean_text(exp.get('description', '')),
-                    'location': self._clean_text(exp.get('location', '')),
-                }
-                
-                # Parse duration
-                cleaned_exp['duration_info'] = self.parse_duration(cleaned_exp['duration'])
-                
-                # Extract achievements
-                cleaned_exp['achievements'] = self.extract_achievements(
-                    cleaned_exp['description']
-                )
-                
-                cleaned_experience.append(cleaned_exp)
+            if not isinstance(exp, dict):
+                continue
+            
+            cleaned_exp = {field: clean_text(exp.get(field, '')) for field in EXPERIENCE_TEXT_FIELDS}
+            
+            # Parse duration
+            cleaned_exp['duration_info'] = parse_duration(cleaned_exp['duration'])
+            
+            # Extract achievements from a shared view of the description
+            cleaned_exp['achievements'] = extract_achievements(
+                analyze_text(cleaned_exp['description'])
+            )
+            
+            cleaned_experience.append(cleaned_exp)
         
         return cleaned_experience
     
     def _clean_education_list(self, education_list: List[Dict]) -> List[Dict]:
         """Clean education entries"""
-        cleaned_education = []
-        
-        for edu in education_list:
-            if isinstance(edu, dict):
-                cleaned_edu = {
-                    'degree': self._clean_text(edu.get('degree', '')),
-                    'school': self._clean_text(edu.get('school', '')),
-                    'year': self._clean_text(edu.get('year', '')),
-                    'field': self._clean_text(edu.get('field', '')),
-                }
-                cleaned_education.append(cleaned_edu)
-        
-        return cleaned_education
+        clean_text = self._clean_text
+        
+        return [
+            {field: clean_text(edu.get(field, '')) for field in EDUCATION_TEXT_FIELDS}
+            for edu in education_list if isinstance(edu, dict)
+        ]
     
-    def _clean_skills_list(self, skills_list: List[str]) -> List[str]:
-        """Clean and deduplicate skills"""
+    def _clean_skills_list(self, skills_list: List[str]) -> Tuple[List[str], Dict[str, List[str]]]:
+        """Clean, deduplicate and categorize skills in one pass"""
+        cleaned_skills = []
+        categorized = self._empty_skill_categories()
         if not skills_list:
-            return []
+            return cleaned_skills, categorized
         
-        cleaned_skills = []
         seen_skills = set()
         
         for skill in skills_list:
@@ -267,22 +425,15 @@ class LinkedInParser:
             if cleaned_skill and skill_lower not in seen_skills:
                 cleaned_skills.append(cleaned_skill)
                 seen_skills.add(skill_lower)
+                # Reuse the lowercased form for categorization
+                categorized[self._skill_category(skill_lower)].append(cleaned_skill)
         
-        return cleaned_skills
+        return cleaned_skills, categorized
     
     def _parse_connections(self, connections_str: str) -> int:
         """Parse connection count from string"""
         if not connections_str:
             return 0
         
-        # Extract numbers from connection string
-        numbers = re.findall(r'\d+', connections_str)
-        
-        if numbers:
-            return int(numbers[0])
-        
-        # Handle "500+" format
-        if '500+' in connections_str:
-            return 500
-        
-        return 0
+        # First number in the connection string; "500+" yields 500
+        return _first_number(connections_str)
@@ -0,0 +1,137 @@
+# Persistent Profile Cache
+import os
+import re
+import stat
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+import orjson
+
+# Scraped profiles hold personal data, so the default lives in a per-user cache directory
+DEFAULT_CACHE_PATH = os.path.join(
+    os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'linkedin_enhancer',
+    'profiles.sqlite3'
+)
+DEFAULT_TTL_SECONDS = 24 * 60 * 60  # Scraped profiles are reused for a day
+DEFAULT_MAX_ROWS = int(os.getenv('PROFILE_CACHE_MAX_ROWS', '1000'))
+
+_URL_PREFIX_PATTERN = re.compile(r'^(?:https?://)?(?:www\.)?', re.IGNORECASE)
+
+def _is_private(st: os.stat_result) -> bool:
+    """Owned by this user and not writable by group or others"""
+    owned = not hasattr(os, 'getuid') or st.st_uid == os.getuid()
+    return owned and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+def _prepare_private_file(path: str) -> bool:
+    """Create path's directory (0700) and the file itself (0600); False if either is not private"""
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not _is_private(os.stat(directory)):
+            print(f"⚠️ Profile cache directory {directory} is not private to this user")
+            return False
+        
+        # O_NOFOLLOW so a planted symlink can't redirect the cache elsewhere
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_NOFOLLOW', 0), 0o600)
+        try:
+            st = os.fstat(fd)
+            if not _is_private(st) or st.st_mode & (stat.S_IRGRP | stat.S_IROTH):
+                print(f"⚠️ Profile cache file {path} is not private to this user")
+                return False
+        finally:
+            os.close(fd)
+    except OSError as e:
+        print(f"⚠️ Cannot use profile cache at {path}: {e}")
+        return False
+    return True
+
+class ProfileCache:
+    """SQLite-backed cache of scraped LinkedIn profiles keyed on profile URL"""
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 max_rows: int = DEFAULT_MAX_ROWS):
+        self.path = path or os.getenv('PROFILE_CACHE_PATH', DEFAULT_CACHE_PATH)
+        self.ttl_seconds = ttl_seconds
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        
+        # Never read or write a cache file another user could see or plant; keep it in memory instead
+        if not _prepare_private_file(self.path):
+            print("⚠️ Falling back to an in-memory profile cache")
+            self.path = ':memory:'
+
+        # Shared across the worker threads used by the Gradio/Streamlit handlers
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS profiles ("
+                "url TEXT PRIMARY KEY, data BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def normalize_url(linkedin_url: str) -> str:
+        """Reduce a profile URL to a stable cache key"""
+        return _URL_PREFIX_PATTERN.sub('', linkedin_url.strip()).rstrip('/').lower()
+
+    def get(self, linkedin_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Return cached profile data for a URL if present and not expired
+
+        Args:
+            linkedin_url (str): LinkedIn profile URL
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached profile data or None
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT data, stored_at FROM profiles WHERE url = ?",
+                    (self.normalize_url(linkedin_url),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"⚠️ Profile cache read failed: {e}")
+            return None
+
+        if not row or time.time() - row[1] > self.ttl_seconds:
+            return None
+
+        try:
+            return orjson.loads(row[0])
+        except orjson.JSONDecodeError as e:
+            print(f"⚠️ Ignoring corrupt profile cache entry: {e}")
+            return None
+
+    def set(self, linkedin_url: str, profile_data: Dict[str, Any]) -> None:
+        """Store profile data for a URL, dropping expired rows and the oldest beyond max_rows"""
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO profiles (url, data, stored_at) VALUES (?, ?, ?)",
+                    (self.normalize_url(linkedin_url), orjson.dumps(profile_data), now)
+                )
+                self._conn.execute(
+                    "DELETE FROM profiles WHERE stored_at < ?",
+                    (now - self.ttl_seconds,)
+                )
+                self._conn.execute(
+                    "DELETE FROM profiles WHERE url NOT IN "
+                    "(SELECT url FROM profiles ORDER BY stored_at DESC LIMIT ?)",
+                    (self.max_rows,)
+                )
+        except (sqlite3.Error, TypeError) as e:
+            print(f"⚠️ Profile cache write failed: {e}")
+
+    def delete(self, linkedin_url: str) -> None:
+        """Remove a cached profile"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM profiles WHERE url = ?",
+                    (self.normalize_url(linkedin_url),)
+                )
+        except sqlite3.Error as e:
+            print(f"⚠️ Profile cache delete failed: {e}")
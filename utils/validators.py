@@ -0,0 +1,10 @@
+# Input Validators
+# Kept free of heavy imports so the UIs can validate input at startup cheaply
+import re
+
+# Accepts profile URLs such as https://www.linkedin.com/in/name (scheme optional),
+# optionally followed by a path, query string or fragment
+LINKEDIN_URL_PATTERN = re.compile(
+    r'^(?:https?://)?(?:[\w-]+\.)?linkedin\.com/in/[\w\-%.]+(?:[/?#].*)?$',
+    re.IGNORECASE
+)